@@ -52,6 +52,8 @@ def main():
     print(f"Total articles sent: {stats['total_sent']}")
     print(f"History file: {stats['history_file']}")
     
+    telegram.close()
+    
     print("\n" + "="*80)
     print("Note: Only NEW articles are sent. Run again to see deduplication in action!")
     print("="*80)
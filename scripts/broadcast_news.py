@@ -216,6 +216,8 @@ Examples:
         logger.error(f"Error broadcasting news: {e}")
         logger.exception("Full traceback:")
         sys.exit(1)
+    finally:
+        telegram.close()
 
 
 if __name__ == "__main__":
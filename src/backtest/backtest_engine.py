@@ -45,6 +45,11 @@ class BacktestEngine:
         """
         self.strategies = strategies
         self.risk_manager = risk_manager
+        
+        # Strategy lookup for exit checks (first strategy wins on duplicate names)
+        self._strategy_by_name: Dict[str, BaseStrategy] = {}
+        for strategy in strategies:
+            self._strategy_by_name.setdefault(strategy.name, strategy)
         self.initial_capital = initial_capital
         self.interval_minutes = interval_minutes
         
@@ -57,6 +62,10 @@ class BacktestEngine:
         # Bar data for each symbol
         self.symbol_data: Dict[str, pd.DataFrame] = {}
         
+        # Row position of each timestamp in the symbol's DataFrame, so the
+        # bar loop can slice history positionally instead of masking
+        self.symbol_rows: Dict[str, Dict[datetime, int]] = {}
+        
         # Current regime and sentiment (placeholder for LLM integration)
         self.current_regime: Optional[MarketRegime] = None
         self.current_sentiment: Dict[str, Optional[Sentiment]] = {}
@@ -93,6 +102,10 @@ class BacktestEngine:
             df = self._bars_to_dataframe(bars)
             df = calculate_all_indicators(df)
             self.symbol_data[symbol] = df
+            # First row wins for duplicated timestamps
+            rows = self.symbol_rows[symbol] = {}
+            for i, ts in enumerate(df['timestamp']):
+                rows.setdefault(ts, i)
             logger.info(f"Loaded {len(df)} bars for {symbol}")
         
         # Get all unique timestamps across all symbols
@@ -109,7 +122,7 @@ class BacktestEngine:
             
             # Log progress periodically
             if (i + 1) % 50 == 0:
-                logger.debug(f"Processed {i + 1}/{len(sorted_timestamps)} bars")
+                logger.debug("Processed {}/{} bars", i + 1, len(sorted_timestamps))
         
         # Close any remaining positions at the end
         self._close_all_positions(sorted_timestamps[-1])
@@ -132,21 +145,20 @@ class BacktestEngine:
         Returns:
             DataFrame with OHLCV data
         """
-        data = []
-        for bar in bars:
-            data.append({
-                'timestamp': bar.timestamp,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            })
-        
-        df = pd.DataFrame(data)
-        df = df.sort_values('timestamp').reset_index(drop=True)
+        # Build column-wise; avoids the per-row dict parsing of DataFrame(records)
         # Set timestamp as index for VWAP calculation
-        df = df.set_index('timestamp')
+        df = pd.DataFrame(
+            {
+                'open': [bar.open for bar in bars],
+                'high': [bar.high for bar in bars],
+                'low': [bar.low for bar in bars],
+                'close': [bar.close for bar in bars],
+                'volume': [bar.volume for bar in bars],
+            },
+            index=pd.DatetimeIndex([bar.timestamp for bar in bars], name='timestamp')
+        )
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index(kind='stable')
         # Keep timestamp as column too for easier access
         df['timestamp'] = df.index
         return df
@@ -160,15 +172,15 @@ class BacktestEngine:
         """
         # Update positions with current prices
         for symbol, position in list(self.portfolio.positions.items()):
-            df = self.symbol_data[symbol]
-            current_bar = df[df['timestamp'] == timestamp]
+            row = self.symbol_rows[symbol].get(timestamp)
             
-            if not current_bar.empty:
-                current_price = current_bar.iloc[0]['close']
+            if row is not None:
+                current_bar = self.symbol_data[symbol].iloc[row]
+                current_price = current_bar['close']
                 position.update_pnl(current_price)
                 
                 # Check for exit conditions
-                self._check_exit_conditions(symbol, position, current_bar.iloc[0], timestamp)
+                self._check_exit_conditions(symbol, position, current_bar, timestamp)
         
         # Update portfolio unrealized P&L
         self.portfolio.update_unrealized_pnl()
@@ -179,8 +191,7 @@ class BacktestEngine:
             return
         
         # Check daily loss limit
-        daily_loss_limit = self.risk_manager.initial_capital * self.risk_manager.config.max_daily_loss
-        if self.portfolio.daily_pnl < -daily_loss_limit:
+        if self.portfolio.daily_pnl < -self.risk_manager.daily_loss_limit:
             logger.warning(f"Daily loss limit reached: ₹{self.portfolio.daily_pnl:,.2f}")
             return
         
@@ -195,12 +206,14 @@ class BacktestEngine:
             if symbol in self.portfolio.positions:
                 continue
             
-            # Get data up to current timestamp
-            historical_df = df[df['timestamp'] <= timestamp].copy()
+            # Get data up to current timestamp (rows are sorted by time)
+            end = df.index.searchsorted(timestamp, side='right')
             
-            if len(historical_df) < 50:  # Need minimum data for indicators
+            if end < 50:  # Need minimum data for indicators
                 continue
             
+            historical_df = df.iloc[:end]
+            
             # Evaluate each strategy
             for strategy in self.strategies:
                 instruction = strategy.evaluate(
@@ -250,23 +263,22 @@ class BacktestEngine:
         # Check strategy exit signal
         else:
             # Get historical data for strategy evaluation
-            df = self.symbol_data[symbol]
-            historical_df = df[df['timestamp'] <= timestamp].copy()
+            row = self.symbol_rows[symbol][timestamp]
+            historical_df = self.symbol_data[symbol].iloc[:row + 1]
             
             # Find the strategy that opened this position
-            for strategy in self.strategies:
-                if strategy.name == position.strategy_name:
-                    instruction = strategy.evaluate(
-                        df=historical_df,
-                        current_position="long" if position.quantity > 0 else "short",
-                        regime=self.current_regime,
-                        sentiment=self.current_sentiment.get(symbol)
-                    )
-                    
-                    if instruction.signal == StrategySignal.EXIT_LONG:
-                        exit_reason = "strategy_exit"
-                        logger.info(f"Strategy exit signal for {symbol}")
-                    break
+            strategy = self._strategy_by_name.get(position.strategy_name)
+            if strategy is not None:
+                instruction = strategy.evaluate(
+                    df=historical_df,
+                    current_position="long" if position.quantity > 0 else "short",
+                    regime=self.current_regime,
+                    sentiment=self.current_sentiment.get(symbol)
+                )
+                
+                if instruction.signal == StrategySignal.EXIT_LONG:
+                    exit_reason = "strategy_exit"
+                    logger.info(f"Strategy exit signal for {symbol}")
         
         # Execute exit if needed
         if exit_reason:
@@ -297,14 +309,14 @@ class BacktestEngine:
         )
         
         if not is_allowed:
-            logger.debug(f"Trade rejected by risk manager for {symbol}: {reason}")
+            logger.debug("Trade rejected by risk manager for {}: {}", symbol, reason)
             return
         
         # Calculate position size based on risk management
         quantity = self.risk_manager.calculate_position_size(instruction, self.portfolio)
         
         if quantity == 0:
-            logger.debug(f"Position size calculated as 0 for {symbol}, skipping trade")
+            logger.debug("Position size calculated as 0 for {}, skipping trade", symbol)
             return
         
         # Create position
@@ -372,11 +384,10 @@ class BacktestEngine:
             timestamp: Final timestamp
         """
         for symbol, position in list(self.portfolio.positions.items()):
-            df = self.symbol_data[symbol]
-            final_bar = df[df['timestamp'] == timestamp]
+            row = self.symbol_rows[symbol].get(timestamp)
             
-            if not final_bar.empty:
-                final_price = final_bar.iloc[0]['close']
+            if row is not None:
+                final_price = self.symbol_data[symbol].iloc[row]['close']
                 self._execute_exit(symbol, final_price, "end_of_backtest", timestamp)
     
     def _generate_results(self) -> Dict:
@@ -237,14 +237,34 @@ class TradingConfig(BaseModel):
         Path("backtest_results").mkdir(exist_ok=True)
 
 
-# Global configuration instance
+# Global configuration instance and fingerprint of the environment it was built from
 config: TradingConfig | None = None
+_config_env_fingerprint: int | None = None
+
+
+def _env_fingerprint() -> int:
+    """Hash of the current environment, used to detect config changes."""
+    return hash(frozenset(os.environ.items()))
 
 
 def get_config() -> TradingConfig:
-    """Get or create the global configuration instance."""
-    global config
-    if config is None:
+    """
+    Get or create the global configuration instance.
+    
+    The instance is only rebuilt when the environment has changed since it
+    was created, so repeated calls (e.g. an in-process parameter sweep) skip
+    re-validation while still picking up changed environment overrides.
+    
+    The result reflects the environment only. Callers that override fields
+    (e.g. main() applying --mode/--symbols) must do so on a
+    ``model_copy(deep=True)`` and pass that copy on explicitly; overrides
+    are never visible through get_config(), and a rebuild after an
+    environment change would discard them anyway.
+    """
+    global config, _config_env_fingerprint
+    fingerprint = _env_fingerprint()
+    if config is None or fingerprint != _config_env_fingerprint:
         config = TradingConfig.from_env()
         config.ensure_directories()
+        _config_env_fingerprint = fingerprint
     return config
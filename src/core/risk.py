@@ -11,7 +11,8 @@ CRITICAL: This module must NEVER be influenced by LLM outputs.
 All risk decisions are deterministic and rule-based.
 """
 
-from datetime import datetime, time
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
 from typing import Optional
 
 from loguru import logger
@@ -19,6 +20,25 @@ from loguru import logger
 from src.config import RiskConfig
 from src.data.models import TradeInstruction, Portfolio, StrategySignal
 
+# Market hours for NSE: 9:15 AM to 3:30 PM IST
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
+
+
+@dataclass(slots=True)
+class RiskMetrics:
+    """Snapshot of risk limits and their current usage."""
+    kill_switch_active: bool
+    kill_switch_reason: str
+    daily_pnl: float
+    daily_loss_limit: float
+    daily_loss_used_pct: float
+    daily_trades: int
+    daily_losing_trades: int
+    max_losing_trades: int
+    max_risk_per_trade_pct: float
+    max_daily_loss_pct: float
+
 
 class RiskManager:
     """Risk management and position sizing."""
@@ -35,6 +55,17 @@ class RiskManager:
         self.initial_capital = initial_capital
         self.kill_switch_active = False
         self.kill_switch_reason = ""
+        
+        # Absolute daily loss limit, checked on every entry
+        self.daily_loss_limit = initial_capital * config.max_daily_loss
+        
+        # Time filter thresholds are fixed by config, so derive them once
+        self._earliest_entry = (
+            datetime.combine(datetime.min, MARKET_OPEN)
+            + timedelta(minutes=config.min_minutes_after_open)
+        ).time()
+        hour, minute = config.cutoff_time.split(":")
+        self._cutoff = time(int(hour), int(minute))
     
     def validate_trade(
         self,
@@ -65,10 +96,9 @@ class RiskManager:
             return True, "Not an entry signal"
         
         # Check daily loss limit
-        daily_loss_limit = self.initial_capital * self.config.max_daily_loss
-        if portfolio.daily_pnl < -daily_loss_limit:
+        if portfolio.daily_pnl < -self.daily_loss_limit:
             self._activate_kill_switch(
-                f"Daily loss limit breached: {portfolio.daily_pnl:.2f} < -{daily_loss_limit:.2f}"
+                f"Daily loss limit breached: {portfolio.daily_pnl:.2f} < -{self.daily_loss_limit:.2f}"
             )
             return False, self.kill_switch_reason
         
@@ -154,34 +184,26 @@ class RiskManager:
         Returns:
             Tuple of (is_allowed, reason)
         """
-        # Market hours for NSE: 9:15 AM to 3:30 PM IST
-        market_open = time(9, 15)
-        market_close = time(15, 30)
-        
         current_time_only = current_time.time()
         
         # Check if market is open
-        if current_time_only < market_open or current_time_only > market_close:
+        if current_time_only < MARKET_OPEN or current_time_only > MARKET_CLOSE:
             return False, f"Market closed: current time {current_time_only}"
         
         # Check min minutes after open
-        minutes_after_open = (
-            current_time_only.hour * 60 + current_time_only.minute -
-            (market_open.hour * 60 + market_open.minute)
-        )
-        
-        if minutes_after_open < self.config.min_minutes_after_open:
+        if current_time_only < self._earliest_entry:
+            minutes_after_open = (
+                current_time_only.hour * 60 + current_time_only.minute -
+                (MARKET_OPEN.hour * 60 + MARKET_OPEN.minute)
+            )
             return False, (
                 f"Too early: {minutes_after_open} minutes after open, "
                 f"minimum {self.config.min_minutes_after_open}"
             )
         
         # Check cutoff time
-        cutoff_parts = self.config.cutoff_time.split(":")
-        cutoff = time(int(cutoff_parts[0]), int(cutoff_parts[1]))
-        
-        if current_time_only >= cutoff:
-            return False, f"Past cutoff time: {current_time_only} >= {cutoff}"
+        if current_time_only >= self._cutoff:
+            return False, f"Past cutoff time: {current_time_only} >= {self._cutoff}"
         
         return True, "Time filters passed"
     
@@ -207,7 +229,7 @@ class RiskManager:
         logger.info("Daily risk limits reset")
         # Note: Portfolio daily stats should also be reset separately
     
-    def get_risk_metrics(self, portfolio: Portfolio) -> dict:
+    def get_risk_metrics(self, portfolio: Portfolio) -> RiskMetrics:
         """
         Get current risk metrics.
         
@@ -215,20 +237,20 @@ class RiskManager:
             portfolio: Current portfolio state
             
         Returns:
-            Dictionary of risk metrics
+            RiskMetrics snapshot
         """
-        daily_loss_limit = self.initial_capital * self.config.max_daily_loss
+        daily_loss_limit = self.daily_loss_limit
         daily_loss_used_pct = (abs(portfolio.daily_pnl) / daily_loss_limit * 100) if portfolio.daily_pnl < 0 else 0
         
-        return {
-            "kill_switch_active": self.kill_switch_active,
-            "kill_switch_reason": self.kill_switch_reason,
-            "daily_pnl": portfolio.daily_pnl,
-            "daily_loss_limit": daily_loss_limit,
-            "daily_loss_used_pct": daily_loss_used_pct,
-            "daily_trades": portfolio.daily_trades,
-            "daily_losing_trades": portfolio.daily_losing_trades,
-            "max_losing_trades": self.config.max_losing_trades_per_day,
-            "max_risk_per_trade_pct": self.config.max_risk_per_trade * 100,
-            "max_daily_loss_pct": self.config.max_daily_loss * 100
-        }
+        return RiskMetrics(
+            kill_switch_active=self.kill_switch_active,
+            kill_switch_reason=self.kill_switch_reason,
+            daily_pnl=portfolio.daily_pnl,
+            daily_loss_limit=daily_loss_limit,
+            daily_loss_used_pct=daily_loss_used_pct,
+            daily_trades=portfolio.daily_trades,
+            daily_losing_trades=portfolio.daily_losing_trades,
+            max_losing_trades=self.config.max_losing_trades_per_day,
+            max_risk_per_trade_pct=self.config.max_risk_per_trade * 100,
+            max_daily_loss_pct=self.config.max_daily_loss * 100
+        )
@@ -260,7 +260,7 @@ class KiteDataFetcher:
             with open(cache_file, 'w') as f:
                 json.dump(data, f, indent=2)
             
-            logger.debug(f"Cached {len(bars)} bars to {cache_file}")
+            logger.debug("Cached {} bars to {}", len(bars), cache_file)
             
         except Exception as e:
             logger.warning(f"Error saving cache for {symbol}: {e}")
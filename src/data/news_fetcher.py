@@ -10,25 +10,199 @@ Includes caching and deduplication to avoid redundant fetches.
 """
 
 import hashlib
-import json
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Set
-from urllib.parse import quote
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import quote, urlsplit, urlunsplit
 
 import feedparser
+import numpy as np
 import requests
 from loguru import logger
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.data.models import NewsArticle, NewsSource
 
 
+# Near-duplicate detection: articles whose 64-bit SimHash fingerprints differ
+# in at most SIMHASH_MAX_DISTANCE bits are treated as the same story.
+SIMHASH_BITS = 64
+SIMHASH_MAX_DISTANCE = 3
+# With MAX_DISTANCE + 1 bands, two fingerprints within the threshold must agree
+# exactly on at least one band, so candidates can be found by dict lookup.
+_SIMHASH_BANDS = SIMHASH_MAX_DISTANCE + 1
+_SIMHASH_BAND_BITS = SIMHASH_BITS // _SIMHASH_BANDS
+_SIMHASH_BAND_MASK = (1 << _SIMHASH_BAND_BITS) - 1
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Adapters are network-bound, so they are fetched concurrently
+MAX_FETCH_WORKERS = 4
+
+# Validates and serializes cache files in pydantic-core, without building
+# intermediate dicts; the file layout matches the model's JSON fields
+_ARTICLE_LIST = TypeAdapter(List[NewsArticle])
+
+# Cache keys kept in memory in front of the on-disk news cache
+MEMORY_CACHE_SIZE = 64
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Canonicalize a URL for duplicate detection.
+    
+    Lowercases scheme and host and drops the query string, fragment and
+    trailing slash, so tracking parameters do not make links look distinct.
+    
+    Args:
+        url: Article URL
+        
+    Returns:
+        Canonical URL
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
+
+
+def _simhash(text: str) -> int:
+    """
+    Compute a 64-bit Charikar SimHash of text.
+    
+    Args:
+        text: Text to fingerprint
+        
+    Returns:
+        Fingerprint as an integer, or 0 if the text has no tokens
+    """
+    tokens = _TOKEN_PATTERN.findall(unicodedata.normalize('NFKC', text).lower())
+    if not tokens:
+        return 0
+    
+    digest_size = SIMHASH_BITS // 8
+    digests = b"".join(
+        hashlib.blake2b(token.encode(), digest_size=digest_size).digest()
+        for token in tokens
+    )
+    
+    # One row of bits per token (most significant first); a bit is set in the
+    # fingerprint when more tokens have it set than clear
+    bits = np.unpackbits(
+        np.frombuffer(digests, dtype=np.uint8).reshape(len(tokens), digest_size),
+        axis=1
+    )
+    majority = 2 * bits.sum(axis=0, dtype=np.int64) > len(tokens)
+    return int.from_bytes(np.packbits(majority).tobytes(), 'big')
+
+
+def _simhash_bands(fingerprint: int) -> List[Tuple[int, int]]:
+    """Split a fingerprint into (band index, band value) index keys."""
+    return [
+        (band, fingerprint >> (band * _SIMHASH_BAND_BITS) & _SIMHASH_BAND_MASK)
+        for band in range(_SIMHASH_BANDS)
+    ]
+
+
+def _compile_symbol_pattern(symbols: Optional[List[str]]) -> Optional[re.Pattern]:
+    """
+    Compile one pattern that finds any of the symbols in upper-cased text.
+    
+    Symbols match only when not embedded in a longer alphanumeric token, so
+    symbols containing '&' or '-' (e.g. M&M, BAJAJ-AUTO) still match.
+    
+    Args:
+        symbols: Stock symbols to look for
+        
+    Returns:
+        Compiled pattern, or None if there are no symbols
+    """
+    if not symbols:
+        return None
+    
+    # Longest first so a symbol never shadows a longer one it prefixes
+    alternatives = sorted({symbol.upper() for symbol in symbols}, key=len, reverse=True)
+    return re.compile(
+        r"(?<![A-Z0-9])(" + "|".join(map(re.escape, alternatives)) + r")(?![A-Z0-9])"
+    )
+
+
 class NewsSourceAdapter:
     """Base class for news source adapters."""
     
+    # Seconds a parsed feed is reused before the server is asked again
+    FEED_TTL = 300
+    
+    # Feed URLs kept in the cache; Google News has one URL per symbol query,
+    # so the least recently used feeds are evicted past this size
+    FEED_CACHE_SIZE = 128
+    
+    def __init__(self):
+        """Initialize adapter with an empty feed cache."""
+        # url -> (parsed at, parsed feed), least recently used first
+        self._feed_cache: OrderedDict[str, Tuple[float, feedparser.FeedParserDict]] = OrderedDict()
+        self._feed_cache_lock = Lock()
+    
     def fetch(self, symbols: Optional[List[str]] = None, max_articles: int = 50) -> List[NewsArticle]:
         """Fetch news articles from the source."""
         raise NotImplementedError
+    
+    def _parse_feed(self, url: str) -> feedparser.FeedParserDict:
+        """
+        Parse an RSS feed, reusing recent results.
+        
+        Within FEED_TTL the previous parse is returned without a request.
+        After that the feed is requested with its ETag and Last-Modified
+        values, and a 304 Not Modified response reuses the previous parse.
+        
+        Args:
+            url: Feed URL
+            
+        Returns:
+            Parsed feed
+        """
+        now = time.monotonic()
+        with self._feed_cache_lock:
+            cached = self._feed_cache.get(url)
+            if cached is not None:
+                self._feed_cache.move_to_end(url)
+        
+        if cached is None:
+            feed = feedparser.parse(url)
+        else:
+            parsed_at, previous = cached
+            if now - parsed_at < self.FEED_TTL:
+                return previous
+            
+            feed = feedparser.parse(
+                url,
+                etag=previous.get('etag'),
+                modified=previous.get('modified')
+            )
+            if feed.get('status') == 304:
+                logger.debug("Feed not modified: {}", url)
+                self._cache_feed(url, now, previous)
+                return previous
+        
+        # Failed fetches come back without entries; don't pin them in the cache
+        if feed.entries:
+            self._cache_feed(url, now, feed)
+        return feed
+    
+    def _cache_feed(self, url: str, parsed_at: float, feed: feedparser.FeedParserDict) -> None:
+        """Store a parsed feed, evicting the least recently used past FEED_CACHE_SIZE."""
+        with self._feed_cache_lock:
+            self._feed_cache[url] = (parsed_at, feed)
+            self._feed_cache.move_to_end(url)
+            while len(self._feed_cache) > self.FEED_CACHE_SIZE:
+                self._feed_cache.popitem(last=False)
 
 
 class EconomicTimesAdapter(NewsSourceAdapter):
@@ -42,11 +216,12 @@ class EconomicTimesAdapter(NewsSourceAdapter):
     def fetch(self, symbols: Optional[List[str]] = None, max_articles: int = 50) -> List[NewsArticle]:
         """Fetch news from Economic Times RSS feeds."""
         articles = []
+        symbol_pattern = _compile_symbol_pattern(symbols)
         
         for feed_name, feed_url in self.RSS_FEEDS.items():
             try:
-                logger.debug(f"Fetching Economic Times {feed_name} feed")
-                feed = feedparser.parse(feed_url)
+                logger.debug("Fetching Economic Times {} feed", feed_name)
+                feed = self._parse_feed(feed_url)
                 
                 for entry in feed.entries[:max_articles]:
                     try:
@@ -57,12 +232,9 @@ class EconomicTimesAdapter(NewsSourceAdapter):
                         
                         # Extract symbols from title/summary if provided
                         extracted_symbols = []
-                        if symbols:
-                            title_upper = entry.title.upper()
-                            summary_upper = entry.get('summary', '').upper()
-                            for symbol in symbols:
-                                if symbol.upper() in title_upper or symbol.upper() in summary_upper:
-                                    extracted_symbols.append(symbol.upper())
+                        if symbol_pattern:
+                            text = f"{entry.title}\n{entry.get('summary', '')}".upper()
+                            extracted_symbols = list(dict.fromkeys(symbol_pattern.findall(text)))
                         
                         article = NewsArticle(
                             title=entry.title,
@@ -95,6 +267,8 @@ class GoogleNewsAdapter(NewsSourceAdapter):
         """Fetch news from Google News RSS feeds."""
         articles = []
         
+        symbol_pattern = _compile_symbol_pattern(symbols)
+        
         # Default query for Indian stock market
         queries = ["Indian stock market NSE BSE"]
         
@@ -109,8 +283,8 @@ class GoogleNewsAdapter(NewsSourceAdapter):
                 encoded_query = quote(query)
                 feed_url = f"{self.BASE_URL}?q={encoded_query}&hl=en-IN&gl=IN&ceid=IN:en"
                 
-                logger.debug(f"Fetching Google News for query: {query}")
-                feed = feedparser.parse(feed_url)
+                logger.debug("Fetching Google News for query: {}", query)
+                feed = self._parse_feed(feed_url)
                 
                 for entry in feed.entries[:max_articles // len(queries)]:
                     try:
@@ -121,11 +295,10 @@ class GoogleNewsAdapter(NewsSourceAdapter):
                         
                         # Extract symbols from title
                         extracted_symbols = []
-                        if symbols:
-                            title_upper = entry.title.upper()
-                            for symbol in symbols:
-                                if symbol.upper() in title_upper:
-                                    extracted_symbols.append(symbol.upper())
+                        if symbol_pattern:
+                            extracted_symbols = list(
+                                dict.fromkeys(symbol_pattern.findall(entry.title.upper()))
+                            )
                         
                         article = NewsArticle(
                             title=entry.title,
@@ -164,6 +337,20 @@ class NSEAnnouncementsAdapter(NewsSourceAdapter):
     # NSE API endpoints (may require headers to work)
     ANNOUNCEMENTS_URL = "https://www.nseindia.com/api/corporate-announcements"
     
+    # Shared keep-alive session so repeat polls reuse the TLS connection
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+            allowed_methods=("GET",)
+        )
+    ))
+    
     def fetch(self, symbols: Optional[List[str]] = None, max_articles: int = 50) -> List[NewsArticle]:
         """Fetch announcements from NSE."""
         articles = []
@@ -177,20 +364,21 @@ class NSEAnnouncementsAdapter(NewsSourceAdapter):
             }
             
             logger.debug("Fetching NSE announcements")
-            response = requests.get(self.ANNOUNCEMENTS_URL, headers=headers, timeout=10)
+            response = self._SESSION.get(self.ANNOUNCEMENTS_URL, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
                 
                 # NSE API structure may vary, adjust as needed
                 announcements = data.get('data', [])
+                wanted_symbols = {s.upper() for s in symbols} if symbols else None
                 
                 for announcement in announcements[:max_articles]:
                     try:
                         symbol = announcement.get('symbol', '').upper()
                         
                         # Filter by symbols if provided
-                        if symbols and symbol not in [s.upper() for s in symbols]:
+                        if wanted_symbols and symbol not in wanted_symbols:
                             continue
                         
                         # Parse date
@@ -251,6 +439,11 @@ class NewsFetcher:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_ttl = cache_ttl
         self.max_age_hours = max_age_hours
+        self._max_age = timedelta(hours=max_age_hours)
+        
+        # In-memory LRU over the cache files: key -> (stored at, articles)
+        self._memory_cache: OrderedDict[str, Tuple[float, List[NewsArticle]]] = OrderedDict()
+        self._memory_cache_lock = Lock()
         
         # Initialize adapters
         self.adapters = {
@@ -292,17 +485,23 @@ class NewsFetcher:
                 logger.info(f"Loaded {len(cached_news)} articles from cache")
                 return cached_news
         
-        # Fetch from all sources
+        # Fetch from all sources concurrently; results keep adapter order
         all_articles = []
-        for source_name, adapter in self.adapters.items():
-            try:
-                articles = adapter.fetch(symbols, max_articles_per_source)
-                all_articles.extend(articles)
-            except Exception as e:
-                logger.error(f"Error fetching from {source_name}: {e}")
-                continue
+        if self.adapters:
+            with ThreadPoolExecutor(
+                max_workers=min(len(self.adapters), MAX_FETCH_WORKERS)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._fetch_from_adapter,
+                        source_name, adapter, symbols, max_articles_per_source
+                    )
+                    for source_name, adapter in self.adapters.items()
+                ]
+                for future in futures:
+                    all_articles.extend(future.result())
         
-        # Deduplicate by URL
+        # Deduplicate by URL and content fingerprint
         deduplicated = self._deduplicate(all_articles)
         
         # Filter by age
@@ -318,6 +517,31 @@ class NewsFetcher:
         logger.info(f"Fetched {len(filtered)} articles total (after deduplication and filtering)")
         return filtered
     
+    def _fetch_from_adapter(
+        self,
+        source_name: str,
+        adapter: NewsSourceAdapter,
+        symbols: Optional[List[str]],
+        max_articles: int
+    ) -> List[NewsArticle]:
+        """
+        Fetch from one adapter, logging and swallowing its errors.
+        
+        Args:
+            source_name: Source name for logging
+            adapter: Adapter to fetch from
+            symbols: Optional list of symbols to filter by
+            max_articles: Maximum articles from this source
+            
+        Returns:
+            Fetched articles, or an empty list on error
+        """
+        try:
+            return adapter.fetch(symbols, max_articles)
+        except Exception as e:
+            logger.error(f"Error fetching from {source_name}: {e}")
+            return []
+    
     def fetch_stock_news(
         self,
         symbol: str,
@@ -346,27 +570,67 @@ class NewsFetcher:
         return symbol_news[:max_articles]
     
     def _deduplicate(self, articles: List[NewsArticle]) -> List[NewsArticle]:
-        """Remove duplicate articles based on URL."""
+        """
+        Remove duplicate articles.
+        
+        An article is a duplicate if its canonical URL was already seen, or if
+        the SimHash of its title and summary is within SIMHASH_MAX_DISTANCE
+        bits of an earlier article's and the two don't name disjoint sets of
+        symbols. NSE announcements skip the fingerprint check: their titles
+        and summaries are boilerplate shared across companies, and the
+        attachment URL already identifies each filing. The first occurrence
+        is kept.
+        
+        Args:
+            articles: Articles in priority order
+            
+        Returns:
+            Unique articles
+        """
         seen_urls: Set[str] = set()
+        # band key -> [(fingerprint, symbols)] of kept articles
+        band_index: Dict[Tuple[int, int], List[Tuple[int, Set[str]]]] = {}
         unique_articles = []
         
         for article in articles:
-            if article.url not in seen_urls:
-                seen_urls.add(article.url)
+            url = _canonical_url(article.url)
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            
+            if article.source == NewsSource.NSE_ANNOUNCEMENTS:
                 unique_articles.append(article)
+                continue
+            
+            fingerprint = _simhash(f"{article.title} {article.summary or ''}")
+            bands = _simhash_bands(fingerprint) if fingerprint else []
+            symbols = set(article.symbols)
+            if any(
+                (fingerprint ^ other).bit_count() <= SIMHASH_MAX_DISTANCE
+                # Stories about different companies are never the same story
+                and not (symbols and other_symbols and symbols.isdisjoint(other_symbols))
+                for key in bands
+                for other, other_symbols in band_index.get(key, ())
+            ):
+                continue
+            
+            for key in bands:
+                band_index.setdefault(key, []).append((fingerprint, symbols))
+            unique_articles.append(article)
         
-        logger.debug(f"Deduplicated {len(articles)} -> {len(unique_articles)} articles")
+        logger.debug("Deduplicated {} -> {} articles", len(articles), len(unique_articles))
         return unique_articles
     
     def _filter_by_age(self, articles: List[NewsArticle]) -> List[NewsArticle]:
         """Filter articles by maximum age."""
-        cutoff_time = datetime.now() - timedelta(hours=self.max_age_hours)
+        # One cutoff per call; each article then costs a single comparison
+        cutoff_time = datetime.now() - self._max_age
         filtered = [
             article for article in articles
             if article.published_at >= cutoff_time
         ]
         
-        logger.debug(f"Filtered by age {len(articles)} -> {len(filtered)} articles")
+        logger.debug("Filtered by age {} -> {} articles", len(articles), len(filtered))
         return filtered
     
     def _get_cache_key(self, symbols: Optional[List[str]]) -> str:
@@ -379,7 +643,19 @@ class NewsFetcher:
     
     def _load_from_cache(self, symbols: Optional[List[str]]) -> Optional[List[NewsArticle]]:
         """Load news from cache if available and fresh."""
-        cache_file = self.cache_dir / self._get_cache_key(symbols)
+        cache_key = self._get_cache_key(symbols)
+        
+        # Memory first: a warm hit skips the file read and JSON decode
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(cache_key)
+            if entry is not None:
+                stored_at, articles = entry
+                if time.monotonic() - stored_at <= self.cache_ttl:
+                    self._memory_cache.move_to_end(cache_key)
+                    return list(articles)
+                del self._memory_cache[cache_key]
+        
+        cache_file = self.cache_dir / cache_key
         
         if not cache_file.exists():
             return None
@@ -387,27 +663,15 @@ class NewsFetcher:
         # Check if cache is still fresh
         cache_age = datetime.now().timestamp() - cache_file.stat().st_mtime
         if cache_age > self.cache_ttl:
-            logger.debug(f"Cache expired (age: {cache_age:.0f}s)")
+            logger.debug("Cache expired (age: {:.0f}s)", cache_age)
             return None
         
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            
-            articles = []
-            for item in data:
-                article = NewsArticle(
-                    title=item['title'],
-                    source=NewsSource(item['source']),
-                    url=item['url'],
-                    published_at=datetime.fromisoformat(item['published_at']),
-                    summary=item.get('summary'),
-                    symbols=item.get('symbols', []),
-                    content=item.get('content')
-                )
-                articles.append(article)
+            articles = _ARTICLE_LIST.validate_json(cache_file.read_bytes())
             
-            return articles
+            # Keep the file's age so the memory entry expires with it
+            self._remember(cache_key, articles, time.monotonic() - cache_age)
+            return list(articles)
             
         except Exception as e:
             logger.warning(f"Error loading cache: {e}")
@@ -415,31 +679,38 @@ class NewsFetcher:
     
     def _save_to_cache(self, articles: List[NewsArticle], symbols: Optional[List[str]]) -> None:
         """Save news to cache."""
-        cache_file = self.cache_dir / self._get_cache_key(symbols)
+        cache_key = self._get_cache_key(symbols)
+        cache_file = self.cache_dir / cache_key
+        self._remember(cache_key, list(articles), time.monotonic())
         
         try:
-            data = []
-            for article in articles:
-                data.append({
-                    'title': article.title,
-                    'source': article.source.value,
-                    'url': article.url,
-                    'published_at': article.published_at.isoformat(),
-                    'summary': article.summary,
-                    'symbols': article.symbols,
-                    'content': article.content
-                })
+            cache_file.write_bytes(_ARTICLE_LIST.dump_json(articles))
             
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            logger.debug(f"Cached {len(articles)} articles to {cache_file}")
+            logger.debug("Cached {} articles to {}", len(articles), cache_file)
             
         except Exception as e:
             logger.warning(f"Error saving cache: {e}")
     
+    def _remember(self, cache_key: str, articles: List[NewsArticle], stored_at: float) -> None:
+        """
+        Store articles in the in-memory cache, evicting the least recently used.
+        
+        Args:
+            cache_key: Cache file name the articles belong to
+            articles: Articles to keep
+            stored_at: time.monotonic() value the entry's TTL counts from
+        """
+        with self._memory_cache_lock:
+            self._memory_cache[cache_key] = (stored_at, articles)
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
     def clear_cache(self) -> None:
         """Clear all cached news."""
+        with self._memory_cache_lock:
+            self._memory_cache.clear()
+        
         for cache_file in self.cache_dir.glob("news_*.json"):
             cache_file.unlink()
             logger.info(f"Deleted cache file: {cache_file}")
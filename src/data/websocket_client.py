@@ -35,6 +35,7 @@ class BarAggregator:
             interval_minutes: Bar interval in minutes
         """
         self.interval_minutes = interval_minutes
+        self.interval = timedelta(minutes=interval_minutes)
         self.current_bars: Dict[str, Dict] = {}  # symbol -> partial bar data
         self.lock = Lock()
     
@@ -76,7 +77,7 @@ class BarAggregator:
             bar = self.current_bars[symbol]
             
             # Check if we need to close current bar and start new one
-            if timestamp >= bar['start_time'] + timedelta(minutes=self.interval_minutes):
+            if timestamp >= bar['start_time'] + self.interval:
                 # Complete the current bar
                 completed_bar = OHLCVBar(
                     timestamp=bar['start_time'],
@@ -171,6 +172,7 @@ class KiteWebSocketClient:
         self.ticker = KiteTicker(config.api_key, config.access_token)
         self.aggregator = BarAggregator(interval_minutes)
         self.instrument_tokens: Dict[str, int] = {}
+        self.token_to_symbol: Dict[int, str] = {}
         
         # Connection state
         self.is_connected = False
@@ -195,6 +197,8 @@ class KiteWebSocketClient:
             tokens: Dictionary mapping symbol to instrument token
         """
         self.instrument_tokens = tokens
+        # Reverse lookup used on every tick batch, so build it once here
+        self.token_to_symbol = {v: k for k, v in tokens.items()}
         logger.info(f"Set instrument tokens for {len(tokens)} symbols")
     
     def start(self) -> None:
@@ -260,8 +264,7 @@ class KiteWebSocketClient:
             ws: WebSocket instance
             ticks: List of tick data
         """
-        # Reverse lookup: token -> symbol
-        token_to_symbol = {v: k for k, v in self.instrument_tokens.items()}
+        token_to_symbol = self.token_to_symbol
         
         for tick in ticks:
             instrument_token = tick.get('instrument_token')
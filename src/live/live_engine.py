@@ -4,6 +4,7 @@ Live trading engine for real-money trading.
 Extends paper trading engine with real order execution via Kite API.
 """
 
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
 from threading import Lock
@@ -145,7 +146,6 @@ class LiveTradingEngine(PaperTradingEngine):
             self.orders_today += 1
             
             # Wait briefly for order to fill
-            import time
             time.sleep(1)
             
             # Update order status
@@ -270,7 +270,6 @@ class LiveTradingEngine(PaperTradingEngine):
             self.orders_today += 1
             
             # Wait briefly for order to fill
-            import time
             time.sleep(1)
             
             # Update order status
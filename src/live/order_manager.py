@@ -283,7 +283,7 @@ class OrderManager:
             if latest.get("status_message"):
                 order.rejection_reason = latest["status_message"]
             
-            logger.debug(f"Order {order_id} status: {order.status}")
+            logger.debug("Order {} status: {}", order_id, order.status)
             
             return order
         
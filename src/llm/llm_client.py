@@ -10,7 +10,6 @@ from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 from loguru import logger
-from openai import OpenAI
 from pydantic import BaseModel
 
 from src.config import LLMConfig, LLMProvider
@@ -52,6 +51,10 @@ class OpenAIClient(LLMClient):
         Args:
             config: LLM configuration
         """
+        # Imported here: the openai package takes ~0.4s to import and is only
+        # needed once an OpenAI client is actually constructed
+        from openai import OpenAI
+        
         self.config = config
         self.client = OpenAI(api_key=config.api_key)
     
@@ -93,7 +96,7 @@ class OpenAIClient(LLMClient):
                 validated = response_model(**result)
                 result = validated.model_dump()
             
-            logger.debug(f"LLM response: {result}")
+            logger.debug("LLM response: {}", result)
             return result
             
         except Exception as e:
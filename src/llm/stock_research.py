@@ -7,6 +7,7 @@ Provides detailed research reports for stocks by aggregating:
 - LLM-generated insights and recommendations
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional
 
@@ -18,6 +19,54 @@ from src.data.news_fetcher import NewsFetcher
 from src.llm.llm_client import LLMClient
 from src.llm.sentiment_analyzer import SentimentAnalyzer
 
+_REPORT_RULE = '=' * 80
+
+# Report layout; sections are filled in by StockResearcher.generate_report
+_REPORT_TEMPLATE = """
+{rule}
+STOCK RESEARCH REPORT: {symbol}
+{rule}
+Generated: {generated}
+
+OPPORTUNITY SCORE: {score:.2f}/1.00
+{score_bar}
+
+SENTIMENT ANALYSIS:
+{sentiment_block}
+KEY CATALYSTS:
+{catalysts_block}
+RISK FACTORS:
+{risks_block}
+RECOMMENDATION:
+{recommendation}
+
+RECENT NEWS ({article_count} articles):
+{news_block}
+{rule}
+"""
+
+_SENTIMENT_TEMPLATE = """  Sentiment: {sentiment}
+  Confidence: {confidence:.0%}
+  Risky Event: {risky}
+  Rationale: {rationale}
+"""
+
+_NEWS_ITEM_TEMPLATE = """
+  {index}. [{source}] {title}
+     Published: {published}
+     URL: {url}
+"""
+
+
+def _numbered_lines(items: List[str]) -> str:
+    """Format items as an indented numbered list, one per line."""
+    return "".join(f"  {i}. {item}\n" for i, item in enumerate(items, 1))
+
+
+# Per-stock research is bound on news and LLM round-trips, so stocks in a
+# batch are researched concurrently
+MAX_RESEARCH_WORKERS = 4
+
 
 class StockResearcher:
     """Comprehensive stock research combining news and sentiment analysis."""
@@ -103,21 +152,26 @@ class StockResearcher:
         max_articles_per_stock: int = 10
     ) -> List[StockResearch]:
         """
-        Research multiple stocks.
+        Research multiple stocks concurrently.
         
         Args:
             symbols: List of stock symbols
             max_articles_per_stock: Maximum articles per stock
             
         Returns:
-            List of StockResearch objects
+            List of StockResearch objects, in the order of symbols
         """
-        results = []
+        if not symbols:
+            return []
         
-        for symbol in symbols:
-            research = self.research_stock(symbol, max_articles_per_stock)
-            if research:
-                results.append(research)
+        with ThreadPoolExecutor(
+            max_workers=min(len(symbols), MAX_RESEARCH_WORKERS)
+        ) as executor:
+            researched = executor.map(
+                lambda symbol: self.research_stock(symbol, max_articles_per_stock),
+                symbols
+            )
+            results = [research for research in researched if research]
         
         logger.info(f"Batch research complete: {len(results)}/{len(symbols)} stocks")
         return results
@@ -225,56 +279,43 @@ Focus on actionable insights for intraday trading (not long-term investing).
         Returns:
             Formatted report string
         """
-        report = f"""
-{'='*80}
-STOCK RESEARCH REPORT: {research.symbol}
-{'='*80}
-Generated: {research.timestamp.strftime('%Y-%m-%d %H:%M:%S IST')}
-
-OPPORTUNITY SCORE: {research.opportunity_score:.2f}/1.00
-{'█' * int(research.opportunity_score * 20)}{'░' * (20 - int(research.opportunity_score * 20))}
-
-SENTIMENT ANALYSIS:
-"""
+        score_blocks = int(research.opportunity_score * 20)
         
         if research.sentiment:
-            report += f"""  Sentiment: {research.sentiment.sentiment.value.upper()}
-  Confidence: {research.sentiment.confidence:.0%}
-  Risky Event: {'Yes' if research.sentiment.is_event_risky else 'No'}
-  Rationale: {research.sentiment.rationale}
-"""
+            sentiment_block = _SENTIMENT_TEMPLATE.format(
+                sentiment=research.sentiment.sentiment.value.upper(),
+                confidence=research.sentiment.confidence,
+                risky='Yes' if research.sentiment.is_event_risky else 'No',
+                rationale=research.sentiment.rationale
+            )
         else:
-            report += "  No sentiment data available\n"
-        
-        report += f"""
-KEY CATALYSTS:
-"""
-        for i, catalyst in enumerate(research.key_catalysts, 1):
-            report += f"  {i}. {catalyst}\n"
-        
-        report += f"""
-RISK FACTORS:
-"""
-        for i, risk in enumerate(research.risk_factors, 1):
-            report += f"  {i}. {risk}\n"
-        
-        report += f"""
-RECOMMENDATION:
-{research.recommendation}
-
-RECENT NEWS ({len(research.news_articles)} articles):
-"""
-        
-        for i, article in enumerate(research.news_articles[:5], 1):
-            report += f"""
-  {i}. [{article.source.value}] {article.title}
-     Published: {article.published_at.strftime('%Y-%m-%d %H:%M')}
-     URL: {article.url}
-"""
+            sentiment_block = "  No sentiment data available\n"
         
+        news_block = "".join(
+            _NEWS_ITEM_TEMPLATE.format(
+                index=i,
+                source=article.source.value,
+                title=article.title,
+                published=article.published_at.strftime('%Y-%m-%d %H:%M'),
+                url=article.url
+            )
+            for i, article in enumerate(research.news_articles[:5], 1)
+        )
         if len(research.news_articles) > 5:
-            report += f"\n  ... and {len(research.news_articles) - 5} more articles\n"
+            news_block += f"\n  ... and {len(research.news_articles) - 5} more articles\n"
         
-        report += f"\n{'='*80}\n"
+        report = _REPORT_TEMPLATE.format(
+            rule=_REPORT_RULE,
+            symbol=research.symbol,
+            generated=research.timestamp.strftime('%Y-%m-%d %H:%M:%S IST'),
+            score=research.opportunity_score,
+            score_bar='█' * score_blocks + '░' * (20 - score_blocks),
+            sentiment_block=sentiment_block,
+            catalysts_block=_numbered_lines(research.key_catalysts),
+            risks_block=_numbered_lines(research.risk_factors),
+            recommendation=research.recommendation,
+            article_count=len(research.news_articles),
+            news_block=news_block
+        )
         
         return report
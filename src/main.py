@@ -7,10 +7,10 @@ Usage:
     uv run -m src.main --mode live --symbols BANKNIFTY
 """
 
-import argparse
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 from loguru import logger
 
@@ -317,8 +317,7 @@ def run_paper_trading(config, symbols):
         logger.info(f"Losing Trades: {status['losing_trades']}")
         
         if status['total_trades'] > 0:
-            win_rate = (status['winning_trades'] / status['total_trades']) * 100
-            logger.info(f"Win Rate: {win_rate:.2f}%")
+            logger.info(f"Win Rate: {status['win_rate']:.2f}%")
         
         logger.info("=" * 80)
 
@@ -481,14 +480,23 @@ def run_live_trading(config, symbols):
         logger.info(f"Orders Placed: {status['orders_today']}")
         
         if status['total_trades'] > 0:
-            win_rate = (status['winning_trades'] / status['total_trades']) * 100
-            logger.info(f"Win Rate: {win_rate:.2f}%")
+            logger.info(f"Win Rate: {status['win_rate']:.2f}%")
         
         logger.info("=" * 80)
 
 
-def main():
-    """Main entry point."""
+def parse_args(argv: Optional[List[str]] = None):
+    """
+    Parse command-line arguments.
+    
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+        
+    Returns:
+        Parsed arguments namespace
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Automated Intraday Trading System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -530,10 +538,23 @@ Examples:
         help="Path to custom config file (optional)"
     )
     
-    args = parser.parse_args()
-    
-    # Load configuration
-    config = get_config()
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point.
+    
+    Args:
+        argv: Argument list (default: sys.argv[1:]). Lets sweep harnesses
+            call main() in-process instead of spawning a new interpreter
+            per run.
+    """
+    args = parse_args(argv)
+    
+    # Load configuration. CLI overrides go on a private copy so they never
+    # leak into the shared instance or into a later in-process run
+    config = get_config().model_copy(deep=True)
     
     # Override mode if provided
     if args.mode:
@@ -6,18 +6,32 @@ with deduplication to avoid repeating news.
 """
 
 import json
-from datetime import datetime
 from pathlib import Path
 from typing import List, Set
 
 from loguru import logger
 
 from src.config import get_config
-from src.data.models import NewsArticle
+from src.data.models import NewsArticle, NewsSource
 from src.data.news_fetcher import NewsFetcher
 from src.notifications.telegram_notifier import TelegramNotifier
 
 
+# Emoji based on source
+_SOURCE_EMOJI = {
+    NewsSource.ECONOMIC_TIMES: '📰',
+    NewsSource.GOOGLE_NEWS: '🌐',
+    NewsSource.NSE_ANNOUNCEMENTS: '📢',
+    NewsSource.MONEYCONTROL: '💼'
+}
+
+# Display label per source, e.g. google_news -> Google News
+_SOURCE_TITLE = {
+    source: source.value.replace('_', ' ').title()
+    for source in NewsSource
+}
+
+
 class NewsBroadcaster:
     """Broadcasts news to Telegram with deduplication."""
     
@@ -25,7 +39,7 @@ class NewsBroadcaster:
         self,
         news_fetcher: NewsFetcher,
         telegram_notifier: TelegramNotifier,
-        sent_news_file: str = "data/sent_news.json"
+        sent_news_file: str = "data/sent_news.jsonl"
     ):
         """
         Initialize news broadcaster.
@@ -33,7 +47,7 @@ class NewsBroadcaster:
         Args:
             news_fetcher: NewsFetcher instance
             telegram_notifier: TelegramNotifier instance
-            sent_news_file: Path to file tracking sent news URLs
+            sent_news_file: Path to append-only log of sent news URLs
         """
         self.news_fetcher = news_fetcher
         self.telegram = telegram_notifier
@@ -44,62 +58,101 @@ class NewsBroadcaster:
         self.sent_urls: Set[str] = self._load_sent_urls()
     
     def _load_sent_urls(self) -> Set[str]:
-        """Load previously sent news URLs from file."""
+        """
+        Load previously sent news URLs from the append-only log.
+        
+        Each line of the log is one JSON-encoded URL. A legacy
+        ``sent_news.json`` file next to the log is migrated on first load,
+        and the log is compacted when it contains duplicate lines.
+        """
         if not self.sent_news_file.exists():
+            legacy_file = self.sent_news_file.with_suffix('.json')
+            if legacy_file.exists() and legacy_file != self.sent_news_file:
+                return self._migrate_legacy_file(legacy_file)
             return set()
         
         try:
-            with open(self.sent_news_file, 'r') as f:
-                data = json.load(f)
-                return set(data.get('sent_urls', []))
+            lines = self.sent_news_file.read_bytes().splitlines()
         except Exception as e:
             logger.warning(f"Error loading sent news file: {e}")
             return set()
+        
+        urls = set()
+        for line in lines:
+            if not line:
+                continue
+            try:
+                urls.add(json.loads(line))
+            except ValueError:
+                # A torn final write only loses that one entry
+                logger.warning(f"Skipping corrupt line in {self.sent_news_file}")
+        
+        if len(lines) > len(urls):
+            self.sent_urls = urls
+            self._save_sent_urls()
+        
+        return urls
+    
+    def _migrate_legacy_file(self, legacy_file: Path) -> Set[str]:
+        """Convert a legacy JSON history file into the append-only log."""
+        try:
+            data = json.loads(legacy_file.read_bytes())
+            urls = set(data.get('sent_urls', []))
+        except Exception as e:
+            logger.warning(f"Error loading legacy sent news file: {e}")
+            return set()
+        
+        self.sent_urls = urls
+        self._save_sent_urls()
+        logger.info(f"Migrated {len(urls)} sent URLs from {legacy_file}")
+        return urls
+    
+    def _append_sent_urls(self, urls: List[str]) -> None:
+        """Append newly sent news URLs to the log."""
+        if not urls:
+            return
+        
+        try:
+            with open(self.sent_news_file, 'a') as f:
+                f.write(''.join(json.dumps(url) + '\n' for url in urls))
+        except Exception as e:
+            logger.error(f"Error saving sent news file: {e}")
     
     def _save_sent_urls(self) -> None:
-        """Save sent news URLs to file."""
+        """Rewrite the log with exactly the URLs currently in memory."""
         try:
-            data = {
-                'sent_urls': list(self.sent_urls),
-                'last_updated': datetime.now().isoformat()
-            }
+            # Stream lines straight from the set; no intermediate list
             with open(self.sent_news_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.writelines(json.dumps(url) + '\n' for url in self.sent_urls)
         except Exception as e:
             logger.error(f"Error saving sent news file: {e}")
     
     def _format_news_message(self, article: NewsArticle) -> str:
         """Format news article for Telegram."""
-        # Emoji based on source
-        source_emoji = {
-            'economic_times': '📰',
-            'google_news': '🌐',
-            'nse_announcements': '📢',
-            'moneycontrol': '💼'
-        }
-        
-        emoji = source_emoji.get(article.source.value, '📰')
+        emoji = _SOURCE_EMOJI.get(article.source, '📰')
         
         # Format message
-        message = f"{emoji} **{article.title}**\n\n"
+        parts = [f"{emoji} **{article.title}**"]
         
         if article.summary:
             # Limit summary to 200 characters
             summary = article.summary[:200]
             if len(article.summary) > 200:
                 summary += "..."
-            message += f"{summary}\n\n"
+            parts.append(summary)
         
         # Add symbols if available
         if article.symbols:
             symbols_str = ", ".join(f"#{symbol}" for symbol in article.symbols)
-            message += f"📊 {symbols_str}\n\n"
+            parts.append(f"📊 {symbols_str}")
         
         # Add source and link
-        message += f"🔗 [{article.source.value.replace('_', ' ').title()}]({article.url})\n"
-        message += f"🕐 {article.published_at.strftime('%Y-%m-%d %H:%M')}"
+        parts.append(
+            f"🔗 [{_SOURCE_TITLE[article.source]}]({article.url})\n"
+            f"🕐 {article.published_at.strftime('%Y-%m-%d %H:%M')}"
+        )
         
-        return message
+        return "\n\n".join(parts)
     
     def broadcast_news(
         self,
@@ -150,36 +203,36 @@ class NewsBroadcaster:
         # Limit to max_articles
         articles_to_send = new_articles[:max_articles]
         
-        # Send each article
-        sent_count = 0
+        # Format all messages up front, then send them in order; the
+        # notifier paces them at 1 message/s per chat and retries RetryAfter
+        messages = []
         for article in articles_to_send:
             try:
-                message = self._format_news_message(article)
-                
-                # Send to Telegram (using sync wrapper)
-                success = self.telegram.send_message_sync(message, parse_mode='Markdown')
-                
-                if not success:
-                    logger.warning(f"Failed to send article: {article.title[:50]}...")
-                    continue
-                
-                # Mark as sent
-                self.sent_urls.add(article.url)
-                sent_count += 1
-                
-                logger.info(f"Sent: {article.title[:50]}...")
-                
-                # Small delay to avoid rate limiting
-                import time
-                time.sleep(0.5)
-                
+                messages.append((article, self._format_news_message(article)))
             except Exception as e:
-                logger.error(f"Error sending article: {e}")
+                logger.error(f"Error formatting article: {e}")
+        
+        results = self.telegram.send_messages_sync(
+            [message for _, message in messages],
+            parse_mode='Markdown'
+        )
+        
+        newly_sent = []
+        for (article, _), success in zip(messages, results):
+            if not success:
+                logger.warning(f"Failed to send article: {article.title[:50]}...")
                 continue
+            
+            # Mark as sent
+            self.sent_urls.add(article.url)
+            newly_sent.append(article.url)
+            
+            logger.info(f"Sent: {article.title[:50]}...")
         
-        # Save sent URLs
-        self._save_sent_urls()
+        # Persist only the URLs sent in this run
+        self._append_sent_urls(newly_sent)
         
+        sent_count = len(newly_sent)
         logger.info(f"Successfully sent {sent_count} articles to Telegram")
         return sent_count
     
@@ -5,19 +5,236 @@ Sends real-time trade notifications and end-of-day reports to Telegram channel.
 """
 
 import asyncio
-from datetime import datetime
-from typing import List, Optional
+import heapq
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import Lock, Thread
+from typing import Dict, List, Optional
 
 from loguru import logger
 from telegram import Bot
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 
 from src.data.models import Trade, Portfolio, TradeJournalEntry
 
 
+# Exit reason emoji for trade exit notifications
+_EXIT_EMOJI = {
+    "target_hit": "🎯",
+    "stop_loss": "🛑",
+    "time_exit": "⏰",
+    "manual": "👤",
+    "strategy_exit": "📊"
+}
+
+# Alert type emoji for risk alerts
+_ALERT_EMOJI = {
+    "kill_switch": "🚨",
+    "daily_loss": "⚠️",
+    "max_trades": "⛔",
+    "time_filter": "⏰"
+}
+
+# Message skeletons, parsed once at import and filled with str.format
+_TRADE_ENTRY_TEMPLATE = """\
+🟢 <b>TRADE ENTRY</b>
+
+📊 <b>{symbol}</b>
+Strategy: {strategy}
+Quantity: {quantity} shares
+Entry: ₹{entry_price:.2f}
+
+🎯 Targets:
+Stop Loss: ₹{stop_loss:.2f} ({stop_loss_pct:+.2f}%)
+Target: ₹{target:.2f} ({target_pct:+.2f}%)
+R:R Ratio: 1:{rr_ratio:.2f}
+
+💡 Reason: {reason}
+
+⏰ {time}
+"""
+
+_TRADE_EXIT_TEMPLATE = """\
+{pnl_emoji} <b>TRADE EXIT</b>
+
+📊 <b>{symbol}</b>
+Strategy: {strategy}
+Quantity: {quantity} shares
+
+💰 P&L: {pnl_sign}₹{pnl:.2f} ({pnl_sign}{pnl_percent:.2f}%)
+
+📈 Prices:
+Entry: ₹{entry_price:.2f}
+Exit: ₹{exit_price:.2f}
+Current: ₹{current_price:.2f}
+
+{exit_emoji} Exit: {exit_reason}
+
+⏰ Duration: {entry_time} → {exit_time}
+"""
+
+_DAILY_SUMMARY_TEMPLATE = """\
+📊 <b>DAILY TRADING SUMMARY</b>
+{date}
+
+{pnl_emoji} <b>P&L: ₹{total_pnl:+.2f}</b>
+
+📈 <b>Trade Statistics:</b>
+Total Trades: {total_trades}
+Winners: {winning_trades} ({win_rate:.1f}%)
+Losers: {losing_trades}
+
+💰 <b>Performance:</b>
+Avg Win: ₹{avg_win:+.2f}
+Avg Loss: ₹{avg_loss:+.2f}
+Largest Win: ₹{largest_win:+.2f}
+Largest Loss: ₹{largest_loss:+.2f}
+
+📊 <b>Portfolio:</b>
+Total P&L: ₹{realized_pnl:+.2f}
+Total Trades: {portfolio_trades}
+Overall Win Rate: {overall_win_rate:.1f}%
+"""
+
+
+@lru_cache(maxsize=64)
+def _label(value: str) -> str:
+    """Human-readable label for a snake_case value, e.g. stop_loss -> Stop Loss."""
+    return value.replace('_', ' ').title()
+
+
+# Telegram rejects messages over 4096 characters; leave some headroom
+MAX_MESSAGE_LENGTH = 4000
+
+
+def _chunk_message(message: str, limit: int = MAX_MESSAGE_LENGTH) -> List[str]:
+    """
+    Split a message into chunks of at most ``limit`` characters.
+    
+    Splits on line boundaries so formatting tags, which never span lines in
+    our messages, stay intact. A single line longer than the limit is cut.
+    
+    Args:
+        message: Message text
+        limit: Maximum chunk length
+        
+    Returns:
+        List of chunks, in order
+    """
+    if len(message) <= limit:
+        return [message]
+    
+    chunks = []
+    current = ""
+    for line in message.split("\n"):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        
+        if not current:
+            current = line
+        elif len(current) + 1 + len(line) <= limit:
+            current += "\n" + line
+        else:
+            chunks.append(current)
+            current = line
+    
+    if current:
+        chunks.append(current)
+    
+    return chunks
+
+
+class RateLimiter:
+    """
+    Sliding-window rate limiter for Telegram Bot API calls.
+    
+    Allows at most ``max_calls`` sends in any ``period`` seconds, and can be
+    paused when Telegram answers with a flood-control RetryAfter. Safe to
+    share between notifiers running on different threads and event loops.
+    """
+    
+    def __init__(self, max_calls: int = 1, period: float = 1.0):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            max_calls: Maximum number of calls per period
+            period: Window length in seconds
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self.calls: deque = deque()
+        self.paused_until = 0.0
+        self._lock = Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until another call is allowed, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    # Drop calls that have left the window
+                    while self.calls and now - self.calls[0] >= self.period:
+                        self.calls.popleft()
+                    
+                    if len(self.calls) < self.max_calls:
+                        self.calls.append(now)
+                        return
+                    
+                    wait = self.period - (now - self.calls[0])
+            
+            await asyncio.sleep(wait)
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Block all calls for the given number of seconds.
+        
+        Args:
+            seconds: Pause duration in seconds
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+# Telegram allows roughly one message per second into a single chat or
+# channel (the 30/s limit is bot-wide), so limiters are kept per chat and
+# shared by every notifier posting there
+_chat_rate_limiters: Dict[str, RateLimiter] = {}
+_chat_rate_limiters_lock = Lock()
+
+
+def _chat_rate_limiter(chat_id: str) -> RateLimiter:
+    """Get the shared rate limiter for a chat, creating it on first use."""
+    with _chat_rate_limiters_lock:
+        limiter = _chat_rate_limiters.get(chat_id)
+        if limiter is None:
+            limiter = _chat_rate_limiters[chat_id] = RateLimiter()
+        return limiter
+
+
 class TelegramNotifier:
     """Send trading notifications to Telegram."""
     
+    # Attempts per message when Telegram responds with flood control
+    MAX_SEND_ATTEMPTS = 3
+    
+    # Seconds a synchronous caller waits for a send to complete
+    SYNC_SEND_TIMEOUT = 60
+    
+    # Keep-alive connections per notifier; independent of the chat's rate
+    # limit so shutdown, get_me and retries never queue behind a send
+    CONNECTION_POOL_SIZE = 8
+    
     def __init__(self, bot_token: str, chat_id: str):
         """
         Initialize Telegram notifier.
@@ -28,13 +245,43 @@ class TelegramNotifier:
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.bot = Bot(token=bot_token)
+        self.rate_limiter = _chat_rate_limiter(str(chat_id))
+        
+        # One pooled keep-alive client per notifier
+        self.bot = Bot(
+            token=bot_token,
+            request=HTTPXRequest(connection_pool_size=self.CONNECTION_POOL_SIZE)
+        )
+        
+        # Dedicated event loop for all sends, so the bot's HTTP client and
+        # its connections live on one loop for the notifier's lifetime
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
         logger.info(f"Telegram notifier initialized for chat {chat_id}")
     
+    def close(self) -> None:
+        """Shut down the bot's HTTP client and stop the notifier's event loop."""
+        if self._loop.is_closed():
+            return
+        
+        future = asyncio.run_coroutine_threadsafe(self.bot.shutdown(), self._loop)
+        try:
+            future.result(timeout=self.SYNC_SEND_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Error shutting down Telegram bot: {e!r}")
+        
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+    
     async def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
         """
         Send a message to Telegram.
         
+        Messages over Telegram's length limit are split on line boundaries
+        and sent as consecutive messages, in order.
+        
         Args:
             message: Message text (supports HTML formatting)
             parse_mode: Parse mode (HTML or Markdown)
@@ -42,17 +289,62 @@ class TelegramNotifier:
         Returns:
             True if sent successfully, False otherwise
         """
-        try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=parse_mode
-            )
-            logger.debug(f"Telegram message sent successfully")
-            return True
-        except TelegramError as e:
-            logger.error(f"Failed to send Telegram message: {e}")
-            return False
+        for chunk in _chunk_message(message):
+            if not await self._send_chunk(chunk, parse_mode):
+                return False
+        return True
+    
+    async def _send_chunk(self, message: str, parse_mode: str) -> bool:
+        """Send a single message within the length limit, retrying on flood control."""
+        for attempt in range(1, self.MAX_SEND_ATTEMPTS + 1):
+            await self.rate_limiter.acquire()
+            try:
+                await self.bot.send_message(
+                    chat_id=self.chat_id,
+                    text=message,
+                    parse_mode=parse_mode
+                )
+                logger.debug("Telegram message sent successfully")
+                return True
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                logger.warning(f"Telegram flood control, retrying in {retry_after}s (attempt {attempt})")
+                self.rate_limiter.pause(retry_after)
+            except TelegramError as e:
+                logger.error(f"Failed to send Telegram message: {e}")
+                return False
+        
+        logger.error("Failed to send Telegram message: flood control retries exhausted")
+        return False
+    
+    async def send_messages(self, messages: List[str], parse_mode: str = "HTML") -> List[bool]:
+        """
+        Send several messages one after another, throttled by the rate limiter.
+        
+        Messages are sent in order, so they appear in the chat in input order.
+        
+        Args:
+            messages: Message texts
+            parse_mode: Parse mode (HTML or Markdown)
+            
+        Returns:
+            Per-message success flags, in input order
+        """
+        results = [False] * len(messages)
+        await self._send_in_order(messages, parse_mode, results)
+        return results
+    
+    async def _send_in_order(
+        self,
+        messages: List[str],
+        parse_mode: str,
+        results: List[bool]
+    ) -> None:
+        """Send messages sequentially, recording each outcome in results as it completes."""
+        for i, message in enumerate(messages):
+            results[i] = await self.send_message(message, parse_mode)
     
     def send_message_sync(self, message: str, parse_mode: str = "HTML") -> bool:
         """
@@ -65,19 +357,45 @@ class TelegramNotifier:
         Returns:
             True if sent successfully
         """
+        future = asyncio.run_coroutine_threadsafe(
+            self.send_message(message, parse_mode), self._loop
+        )
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If loop is already running, create a task
-                asyncio.create_task(self.send_message(message, parse_mode))
-                return True
-            else:
-                # If no loop is running, run it
-                return loop.run_until_complete(self.send_message(message, parse_mode))
+            return future.result(timeout=self.SYNC_SEND_TIMEOUT)
         except Exception as e:
-            logger.error(f"Error in sync send: {e}")
+            future.cancel()
+            logger.error(f"Error in sync send: {e!r}")
             return False
     
+    def send_messages_sync(self, messages: List[str], parse_mode: str = "HTML") -> List[bool]:
+        """
+        Synchronous wrapper for send_messages.
+        
+        Args:
+            messages: Message texts
+            parse_mode: Parse mode
+            
+        Returns:
+            Per-message success flags, in input order. If the batch times
+            out, messages that were already sent still report True.
+        """
+        # Filled in by the loop thread as sends complete, so a timeout can
+        # still report what was delivered
+        results = [False] * len(messages)
+        future = asyncio.run_coroutine_threadsafe(
+            self._send_in_order(messages, parse_mode, results), self._loop
+        )
+        # Sends are paced by the rate limiter, so budget for that on top
+        timeout = self.SYNC_SEND_TIMEOUT + len(messages) * (
+            self.rate_limiter.period / self.rate_limiter.max_calls
+        )
+        try:
+            future.result(timeout=timeout)
+        except Exception as e:
+            future.cancel()
+            logger.error(f"Error in sync send: {e!r}")
+        return list(results)
+    
     def notify_trade_entry(
         self,
         symbol: str,
@@ -107,23 +425,19 @@ class TelegramNotifier:
         reward = abs(target - entry_price) * quantity
         rr_ratio = reward / risk if risk > 0 else 0
         
-        message = f"""
-🟢 <b>TRADE ENTRY</b>
-
-📊 <b>{symbol}</b>
-Strategy: {strategy}
-Quantity: {quantity} shares
-Entry: ₹{entry_price:.2f}
-
-🎯 Targets:
-Stop Loss: ₹{stop_loss:.2f} ({((stop_loss - entry_price) / entry_price * 100):+.2f}%)
-Target: ₹{target:.2f} ({((target - entry_price) / entry_price * 100):+.2f}%)
-R:R Ratio: 1:{rr_ratio:.2f}
-
-💡 Reason: {reason}
-
-⏰ {datetime.now().strftime('%H:%M:%S IST')}
-"""
+        message = _TRADE_ENTRY_TEMPLATE.format(
+            symbol=symbol,
+            strategy=strategy,
+            quantity=quantity,
+            entry_price=entry_price,
+            stop_loss=stop_loss,
+            stop_loss_pct=(stop_loss - entry_price) / entry_price * 100,
+            target=target,
+            target_pct=(target - entry_price) / entry_price * 100,
+            rr_ratio=rr_ratio,
+            reason=reason,
+            time=datetime.now().strftime('%H:%M:%S IST')
+        )
         return self.send_message_sync(message.strip())
     
     def notify_trade_exit(
@@ -147,41 +461,33 @@ R:R Ratio: 1:{rr_ratio:.2f}
         pnl_sign = "+" if trade.pnl > 0 else ""
         
         # Determine exit reason emoji
-        exit_emoji = {
-            "target_hit": "🎯",
-            "stop_loss": "🛑",
-            "time_exit": "⏰",
-            "manual": "👤",
-            "strategy_exit": "📊"
-        }.get(trade.exit_reason, "📤")
+        exit_emoji = _EXIT_EMOJI.get(trade.exit_reason, "📤")
         
-        message = f"""
-{pnl_emoji} <b>TRADE EXIT</b>
-
-📊 <b>{trade.symbol}</b>
-Strategy: {trade.strategy_name}
-Quantity: {trade.quantity} shares
-
-💰 P&L: {pnl_sign}₹{trade.pnl:.2f} ({pnl_sign}{trade.pnl_percent:.2f}%)
-
-📈 Prices:
-Entry: ₹{trade.entry_price:.2f}
-Exit: ₹{trade.exit_price:.2f}
-Current: ₹{current_price:.2f}
-
-{exit_emoji} Exit: {trade.exit_reason.replace('_', ' ').title()}
-
-⏰ Duration: {trade.entry_time.strftime('%H:%M')} → {trade.exit_time.strftime('%H:%M')}
-"""
+        parts = [_TRADE_EXIT_TEMPLATE.format(
+            pnl_emoji=pnl_emoji,
+            symbol=trade.symbol,
+            strategy=trade.strategy_name,
+            quantity=trade.quantity,
+            pnl_sign=pnl_sign,
+            pnl=trade.pnl,
+            pnl_percent=trade.pnl_percent,
+            entry_price=trade.entry_price,
+            exit_price=trade.exit_price,
+            current_price=current_price,
+            exit_emoji=exit_emoji,
+            exit_reason=_label(trade.exit_reason),
+            entry_time=trade.entry_time.strftime('%H:%M'),
+            exit_time=trade.exit_time.strftime('%H:%M')
+        )]
         
         # Add LLM journal review if available
         if journal_entry:
-            message += f"\n🤖 <b>AI Review:</b>\n"
-            message += f"Entry: {journal_entry.entry_label.replace('_', ' ').title()}\n"
-            message += f"Exit: {journal_entry.exit_label.replace('_', ' ').title()}\n"
-            message += f"💭 {journal_entry.exit_review}"
+            parts.append("\n🤖 <b>AI Review:</b>\n")
+            parts.append(f"Entry: {_label(journal_entry.entry_label)}\n")
+            parts.append(f"Exit: {_label(journal_entry.exit_label)}\n")
+            parts.append(f"💭 {journal_entry.exit_review}")
         
-        return self.send_message_sync(message.strip())
+        return self.send_message_sync("".join(parts).strip())
     
     def notify_risk_alert(
         self,
@@ -200,31 +506,26 @@ Current: ₹{current_price:.2f}
         Returns:
             True if sent successfully
         """
-        emoji = {
-            "kill_switch": "🚨",
-            "daily_loss": "⚠️",
-            "max_trades": "⛔",
-            "time_filter": "⏰"
-        }.get(alert_type, "⚠️")
-        
-        alert_msg = f"""
+        emoji = _ALERT_EMOJI.get(alert_type, "⚠️")
+        
+        parts = [f"""
 {emoji} <b>RISK ALERT</b>
 
-Type: {alert_type.replace('_', ' ').title()}
+Type: {_label(alert_type)}
 {message}
-"""
+"""]
         
         if portfolio:
-            alert_msg += f"""
+            parts.append(f"""
 📊 Portfolio Status:
 Daily P&L: ₹{portfolio.daily_pnl:+.2f}
 Daily Trades: {portfolio.daily_trades}
 Losing Trades: {portfolio.daily_losing_trades}
-"""
+""")
         
-        alert_msg += f"\n⏰ {datetime.now().strftime('%H:%M:%S IST')}"
+        parts.append(f"\n⏰ {datetime.now().strftime('%H:%M:%S IST')}")
         
-        return self.send_message_sync(alert_msg.strip())
+        return self.send_message_sync("".join(parts).strip())
     
     def notify_daily_summary(
         self,
@@ -245,67 +546,74 @@ Losing Trades: {portfolio.daily_losing_trades}
         Returns:
             True if sent successfully
         """
-        # Calculate statistics
+        now = datetime.now()
+        
+        # Calculate statistics in a single pass over the trades
         total_trades = len(trades)
-        winning_trades = len([t for t in trades if t.pnl > 0])
-        losing_trades = len([t for t in trades if t.pnl <= 0])
-        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+        winning_trades = losing_trades = 0
+        total_win = total_loss = 0.0
+        largest_win = largest_loss = trades[0].pnl if trades else 0
         
-        total_pnl = sum(t.pnl for t in trades)
-        avg_win = sum(t.pnl for t in trades if t.pnl > 0) / winning_trades if winning_trades > 0 else 0
-        avg_loss = sum(t.pnl for t in trades if t.pnl <= 0) / losing_trades if losing_trades > 0 else 0
+        for t in trades:
+            pnl = t.pnl
+            if pnl > 0:
+                winning_trades += 1
+                total_win += pnl
+            else:
+                losing_trades += 1
+                total_loss += pnl
+            if pnl > largest_win:
+                largest_win = pnl
+            elif pnl < largest_loss:
+                largest_loss = pnl
         
-        largest_win = max((t.pnl for t in trades), default=0)
-        largest_loss = min((t.pnl for t in trades), default=0)
+        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+        total_pnl = total_win + total_loss
+        avg_win = total_win / winning_trades if winning_trades > 0 else 0
+        avg_loss = total_loss / losing_trades if losing_trades > 0 else 0
         
         pnl_emoji = "🟢" if total_pnl > 0 else "🔴" if total_pnl < 0 else "⚪"
         
-        message = f"""
-📊 <b>DAILY TRADING SUMMARY</b>
-{datetime.now().strftime('%d %B %Y')}
-
-{pnl_emoji} <b>P&L: ₹{total_pnl:+.2f}</b>
-
-📈 <b>Trade Statistics:</b>
-Total Trades: {total_trades}
-Winners: {winning_trades} ({win_rate:.1f}%)
-Losers: {losing_trades}
-
-💰 <b>Performance:</b>
-Avg Win: ₹{avg_win:+.2f}
-Avg Loss: ₹{avg_loss:+.2f}
-Largest Win: ₹{largest_win:+.2f}
-Largest Loss: ₹{largest_loss:+.2f}
-
-📊 <b>Portfolio:</b>
-Total P&L: ₹{portfolio.realized_pnl:+.2f}
-Total Trades: {portfolio.total_trades}
-Overall Win Rate: {(portfolio.winning_trades / portfolio.total_trades * 100) if portfolio.total_trades > 0 else 0:.1f}%
-"""
+        parts = [_DAILY_SUMMARY_TEMPLATE.format(
+            date=now.strftime('%d %B %Y'),
+            pnl_emoji=pnl_emoji,
+            total_pnl=total_pnl,
+            total_trades=total_trades,
+            winning_trades=winning_trades,
+            win_rate=win_rate,
+            losing_trades=losing_trades,
+            avg_win=avg_win,
+            avg_loss=avg_loss,
+            largest_win=largest_win,
+            largest_loss=largest_loss,
+            realized_pnl=portfolio.realized_pnl,
+            portfolio_trades=portfolio.total_trades,
+            overall_win_rate=(portfolio.winning_trades / portfolio.total_trades * 100) if portfolio.total_trades > 0 else 0
+        )]
         
         # Add market summary if available
         if market_summary:
-            message += f"\n🌐 <b>Market:</b> {market_summary}\n"
+            parts.append(f"\n🌐 <b>Market:</b> {market_summary}\n")
         
         # Add top trades
         if trades:
-            message += "\n<b>Top Trades:</b>\n"
-            sorted_trades = sorted(trades, key=lambda t: t.pnl, reverse=True)[:3]
-            for i, trade in enumerate(sorted_trades, 1):
+            parts.append("\n<b>Top Trades:</b>\n")
+            top_trades = heapq.nlargest(3, trades, key=lambda t: t.pnl)
+            for i, trade in enumerate(top_trades, 1):
                 emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉"
-                message += f"{emoji} {trade.symbol}: ₹{trade.pnl:+.2f} ({trade.pnl_percent:+.2f}%)\n"
+                parts.append(f"{emoji} {trade.symbol}: ₹{trade.pnl:+.2f} ({trade.pnl_percent:+.2f}%)\n")
         
         # Add LLM insights if available
         if journal_entries:
-            good_entries = len([j for j in journal_entries if j.entry_label == "GOOD_ENTRY"])
-            good_exits = len([j for j in journal_entries if j.exit_label == "GOOD_EXIT"])
-            message += f"\n🤖 <b>AI Analysis:</b>\n"
-            message += f"Good Entries: {good_entries}/{len(journal_entries)}\n"
-            message += f"Good Exits: {good_exits}/{len(journal_entries)}\n"
+            good_entries = sum(1 for j in journal_entries if j.entry_label == "GOOD_ENTRY")
+            good_exits = sum(1 for j in journal_entries if j.exit_label == "GOOD_EXIT")
+            parts.append("\n🤖 <b>AI Analysis:</b>\n")
+            parts.append(f"Good Entries: {good_entries}/{len(journal_entries)}\n")
+            parts.append(f"Good Exits: {good_exits}/{len(journal_entries)}\n")
         
-        message += f"\n⏰ Report generated at {datetime.now().strftime('%H:%M:%S IST')}"
+        parts.append(f"\n⏰ Report generated at {now.strftime('%H:%M:%S IST')}")
         
-        return self.send_message_sync(message.strip())
+        return self.send_message_sync("".join(parts).strip())
     
     def notify_system_start(self, mode: str, watchlist: List[str]) -> bool:
         """
@@ -5,11 +5,11 @@ Processes live market data and simulates trade execution without real money.
 """
 
 from datetime import datetime
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
 from queue import Queue
 from threading import Lock
 
+import numpy as np
 from loguru import logger
 
 from src.data.models import (
@@ -35,7 +35,8 @@ class PaperOrder:
         stop_loss: Optional[float] = None,
         target: Optional[float] = None,
         strategy_name: str = "",
-        reason: str = ""
+        reason: str = "",
+        created_time: Optional[datetime] = None
     ):
         self.symbol = symbol
         self.quantity = quantity
@@ -49,7 +50,94 @@ class PaperOrder:
         self.status = "pending"  # pending, filled, cancelled
         self.filled_price: Optional[float] = None
         self.filled_time: Optional[datetime] = None
-        self.created_time = datetime.now()
+        self.created_time = created_time or datetime.now()
+
+
+class BarBuffer:
+    """
+    Fixed-size bar history for one symbol, stored as column arrays.
+    
+    Bars are written into preallocated NumPy arrays of twice the capacity.
+    When the write position reaches the end, the most recent ``capacity``
+    rows are moved back to the start, so appends are amortized O(1) and the
+    current window is always one contiguous slice.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize bar buffer.
+        
+        Args:
+            capacity: Number of most recent bars to keep
+        """
+        self.capacity = capacity
+        size = capacity * 2
+        self.timestamp = np.empty(size, dtype=object)
+        self.open = np.empty(size, dtype=np.float64)
+        self.high = np.empty(size, dtype=np.float64)
+        self.low = np.empty(size, dtype=np.float64)
+        self.close = np.empty(size, dtype=np.float64)
+        self.volume = np.empty(size, dtype=np.int64)
+        self.start = 0
+        self.end = 0
+        self.appended = 0  # Total bars ever appended, used as a version
+    
+    def __len__(self) -> int:
+        return self.end - self.start
+    
+    @property
+    def last_close(self) -> float:
+        """Close price of the most recent bar."""
+        return float(self.close[self.end - 1])
+    
+    def append(self, bar: OHLCVBar) -> None:
+        """
+        Append a bar, dropping the oldest one once capacity is reached.
+        
+        Args:
+            bar: Completed bar
+        """
+        if self.end == len(self.close):
+            # Compact the live window back to the front of the arrays
+            keep = self.capacity - 1
+            for column in (self.timestamp, self.open, self.high, self.low, self.close, self.volume):
+                column[:keep] = column[self.end - keep:self.end]
+            self.start, self.end = 0, keep
+        
+        i = self.end
+        self.timestamp[i] = bar.timestamp
+        self.open[i] = bar.open
+        self.high[i] = bar.high
+        self.low[i] = bar.low
+        self.close[i] = bar.close
+        self.volume[i] = bar.volume
+        self.end += 1
+        self.appended += 1
+        
+        if self.end - self.start > self.capacity:
+            self.start += 1
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Build a timestamp-indexed OHLCV DataFrame of the current window.
+        
+        Returns:
+            DataFrame with open/high/low/close/volume/timestamp columns
+        """
+        window = slice(self.start, self.end)
+        index = pd.DatetimeIndex(self.timestamp[window], name='timestamp')
+        df = pd.DataFrame(
+            {
+                'open': self.open[window],
+                'high': self.high[window],
+                'low': self.low[window],
+                'close': self.close[window],
+                'volume': self.volume[window],
+            },
+            index=index
+        )
+        df['timestamp'] = df.index
+        return df
 
 
 class PaperTradingEngine:
@@ -77,6 +165,11 @@ class PaperTradingEngine:
         """
         self.strategies = strategies
         self.risk_manager = risk_manager
+        
+        # Strategy lookup for exit checks (first strategy wins on duplicate names)
+        self._strategy_by_name: Dict[str, BaseStrategy] = {}
+        for strategy in strategies:
+            self._strategy_by_name.setdefault(strategy.name, strategy)
         self.initial_capital = initial_capital
         self.interval_minutes = interval_minutes
         
@@ -86,12 +179,16 @@ class PaperTradingEngine:
         # Trade history
         self.trades: List[Trade] = []
         
-        # Pending orders
-        self.pending_orders: List[PaperOrder] = []
+        # Pending orders, keyed by symbol
+        self.pending_orders: Dict[str, List[PaperOrder]] = {}
         
         # Historical bars for each symbol (for indicator calculation)
-        self.symbol_data: Dict[str, List[OHLCVBar]] = defaultdict(list)
         self.max_bars_history = 200  # Keep last 200 bars
+        self.symbol_data: Dict[str, BarBuffer] = {}
+        
+        # Indicator frame per symbol, tagged with the history version it was
+        # built from, so exit and entry checks on one bar share one computation
+        self._indicator_cache: Dict[str, Tuple[int, pd.DataFrame]] = {}
         
         # Thread safety
         self.lock = Lock()
@@ -111,48 +208,98 @@ class PaperTradingEngine:
             bar: New completed bar
         """
         with self.lock:
-            symbol = bar.symbol
-            
-            # Add to history
-            self.symbol_data[symbol].append(bar)
-            
-            # Trim history if too long
-            if len(self.symbol_data[symbol]) > self.max_bars_history:
-                self.symbol_data[symbol] = self.symbol_data[symbol][-self.max_bars_history:]
-            
-            logger.debug(
-                f"New bar: {symbol} | "
-                f"O:{bar.open:.2f} H:{bar.high:.2f} L:{bar.low:.2f} C:{bar.close:.2f} V:{bar.volume}"
-            )
-            
-            # Process pending orders (simulate fills)
-            self._process_pending_orders(bar)
-            
-            # Update positions with current price
-            if symbol in self.portfolio.positions:
-                position = self.portfolio.positions[symbol]
-                position.update_pnl(bar.close)
-                
-                # Check exit conditions
-                self._check_exit_conditions(symbol, position, bar)
-            
-            # Update portfolio unrealized P&L
-            self.portfolio.update_unrealized_pnl()
-            
-            # Check if we can take new positions
-            if not self._can_trade():
-                return
-            
-            # Skip if already in position or have pending order
-            if symbol in self.portfolio.positions or self._has_pending_order(symbol):
-                return
+            self._process_bar(bar)
+    
+    def on_bars(self, bars: List[OHLCVBar]) -> None:
+        """
+        Process a batch of bars, e.g. a backlog replayed after a reconnect.
+        
+        Bars are processed in timestamp order. Every bar fills pending
+        orders and checks stop loss and target, so a backlog bar that
+        breaches a level still exits the position. Strategies (entries and
+        strategy exits) are only evaluated on the latest bar of each symbol.
+        
+        Args:
+            bars: Completed bars (any mix of symbols)
+        """
+        ordered = sorted(bars, key=lambda bar: bar.timestamp)
+        last_index = {bar.symbol: i for i, bar in enumerate(ordered)}
+        
+        with self.lock:
+            for i, bar in enumerate(ordered):
+                self._process_bar(bar, evaluate_strategies=last_index[bar.symbol] == i)
+    
+    def _append_history(self, bar: OHLCVBar) -> BarBuffer:
+        """
+        Add bar to its symbol's history.
+        
+        Args:
+            bar: Completed bar
             
-            # Need minimum bars for indicators
-            if len(self.symbol_data[symbol]) < 50:
-                return
+        Returns:
+            The symbol's bar buffer
+        """
+        # The buffer drops bars beyond max_bars_history
+        history = self.symbol_data.get(bar.symbol)
+        if history is None:
+            history = self.symbol_data[bar.symbol] = BarBuffer(self.max_bars_history)
+        history.append(bar)
+        return history
+    
+    def _process_bar(self, bar: OHLCVBar, evaluate_strategies: bool = True) -> None:
+        """
+        Record bar and run fills, exits and strategy evaluation.
+        
+        Caller must hold self.lock.
+        
+        Args:
+            bar: New completed bar
+            evaluate_strategies: Whether strategies may enter or exit on
+                this bar; stop loss and target are checked regardless
+        """
+        symbol = bar.symbol
+        
+        # Add to history
+        history = self._append_history(bar)
+        
+        # Positional args: loguru only formats them if debug is enabled
+        logger.debug(
+            "New bar: {} | O:{:.2f} H:{:.2f} L:{:.2f} C:{:.2f} V:{}",
+            symbol, bar.open, bar.high, bar.low, bar.close, bar.volume
+        )
+        
+        # Process pending orders (simulate fills)
+        self._process_pending_orders(bar)
+        
+        # Update positions with current price
+        positions = self.portfolio.positions
+        position = positions.get(symbol)
+        if position is not None:
+            position.update_pnl(bar.close)
             
-            # Evaluate strategies
-            self._evaluate_strategies(symbol)
+            # Check exit conditions
+            self._check_exit_conditions(symbol, position, bar, evaluate_strategies)
+        
+        # Update portfolio unrealized P&L
+        self.portfolio.update_unrealized_pnl()
+        
+        if not evaluate_strategies:
+            return
+        
+        # Check if we can take new positions
+        if not self._can_trade():
+            return
+        
+        # Skip if already in position or have pending order
+        if symbol in positions or self._has_pending_order(symbol):
+            return
+        
+        # Need minimum bars for indicators
+        if len(history) < 50:
+            return
+        
+        # Evaluate strategies
+        self._evaluate_strategies(symbol, bar.timestamp)
     
     def _process_pending_orders(self, bar: OHLCVBar) -> None:
         """
@@ -161,23 +308,21 @@ class PaperTradingEngine:
         Args:
             bar: Current bar
         """
-        for order in list(self.pending_orders):
-            if order.symbol != bar.symbol:
-                continue
-            
+        # Every pending market order for this symbol fills on this bar
+        orders = self.pending_orders.pop(bar.symbol, None)
+        if not orders:
+            return
+        
+        for order in orders:
             # Simulate market order fill at bar open
-            if order.status == "pending":
-                fill_price = bar.open
-                order.filled_price = fill_price
-                order.filled_time = bar.timestamp
-                order.status = "filled"
-                
-                # Create position
-                if order.side == "buy":
-                    self._execute_entry(order, fill_price, bar.timestamp)
-                
-                # Remove from pending
-                self.pending_orders.remove(order)
+            fill_price = bar.open
+            order.filled_price = fill_price
+            order.filled_time = bar.timestamp
+            order.status = "filled"
+            
+            # Create position
+            if order.side == "buy":
+                self._execute_entry(order, fill_price, bar.timestamp)
     
     def _execute_entry(
         self,
@@ -224,7 +369,8 @@ class PaperTradingEngine:
         self,
         symbol: str,
         position: Position,
-        bar: OHLCVBar
+        bar: OHLCVBar,
+        evaluate_strategy: bool = True
     ) -> None:
         """
         Check if position should be exited.
@@ -233,6 +379,7 @@ class PaperTradingEngine:
             symbol: Trading symbol
             position: Current position
             bar: Current bar
+            evaluate_strategy: Whether to ask the strategy for an exit signal
         """
         current_price = bar.close
         exit_reason = None
@@ -248,25 +395,22 @@ class PaperTradingEngine:
             logger.info(f"Target hit for {symbol} at ₹{current_price:.2f}")
         
         # Check strategy exit signal
-        else:
-            df = self._get_dataframe(symbol)
-            if df is not None and len(df) >= 50:
-                df = calculate_all_indicators(df)
-                
+        elif evaluate_strategy:
+            df = self._get_indicator_dataframe(symbol)
+            if df is not None:
                 # Find the strategy that opened this position
-                for strategy in self.strategies:
-                    if strategy.name == position.strategy_name:
-                        instruction = strategy.evaluate(
-                            df=df,
-                            current_position="long" if position.quantity > 0 else "short",
-                            regime=self.current_regime,
-                            sentiment=self.current_sentiment.get(symbol)
-                        )
-                        
-                        if instruction.signal == StrategySignal.EXIT_LONG:
-                            exit_reason = "strategy_exit"
-                            logger.info(f"Strategy exit signal for {symbol}")
-                        break
+                strategy = self._strategy_by_name.get(position.strategy_name)
+                if strategy is not None:
+                    instruction = strategy.evaluate(
+                        df=df,
+                        current_position="long" if position.quantity > 0 else "short",
+                        regime=self.current_regime,
+                        sentiment=self.current_sentiment.get(symbol)
+                    )
+                    
+                    if instruction.signal == StrategySignal.EXIT_LONG:
+                        exit_reason = "strategy_exit"
+                        logger.info(f"Strategy exit signal for {symbol}")
         
         # Execute exit if needed
         if exit_reason:
@@ -316,8 +460,7 @@ class PaperTradingEngine:
             return False
         
         # Check daily loss limit
-        daily_loss_limit = self.risk_manager.initial_capital * self.risk_manager.config.max_daily_loss
-        if self.portfolio.daily_pnl < -daily_loss_limit:
+        if self.portfolio.daily_pnl < -self.risk_manager.daily_loss_limit:
             logger.warning(f"Daily loss limit reached: ₹{self.portfolio.daily_pnl:,.2f}")
             return False
         
@@ -338,7 +481,7 @@ class PaperTradingEngine:
         Returns:
             True if pending order exists
         """
-        return any(order.symbol == symbol and order.status == "pending" for order in self.pending_orders)
+        return symbol in self.pending_orders
     
     def _get_dataframe(self, symbol: str) -> Optional[pd.DataFrame]:
         """
@@ -350,42 +493,51 @@ class PaperTradingEngine:
         Returns:
             DataFrame or None
         """
-        bars = self.symbol_data.get(symbol, [])
-        if not bars:
+        history = self.symbol_data.get(symbol)
+        if not history:
             return None
         
-        data = []
-        for bar in bars:
-            data.append({
-                'timestamp': bar.timestamp,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            })
-        
-        df = pd.DataFrame(data)
-        df = df.sort_values('timestamp').reset_index(drop=True)
-        # Set timestamp as index for VWAP calculation
-        df = df.set_index('timestamp')
-        df['timestamp'] = df.index
+        # Bars arrive in time order, so no sort is needed. Timestamp is
+        # the index for VWAP calculation.
+        return history.to_dataframe()
+    
+    def _get_indicator_dataframe(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Get DataFrame with indicators for the symbol's current bar.
+        
+        Indicators are calculated at most once per bar; later calls for the
+        same bar return the cached frame.
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            DataFrame with indicators, or None if there is not enough history
+        """
+        history = self.symbol_data.get(symbol)
+        if history is None or len(history) < 50:
+            return None
+        
+        cached = self._indicator_cache.get(symbol)
+        if cached is not None and cached[0] == history.appended:
+            return cached[1]
+        
+        df = calculate_all_indicators(self._get_dataframe(symbol))
+        self._indicator_cache[symbol] = (history.appended, df)
         return df
     
-    def _evaluate_strategies(self, symbol: str) -> None:
+    def _evaluate_strategies(self, symbol: str, timestamp: datetime) -> None:
         """
         Evaluate strategies for symbol.
         
         Args:
             symbol: Trading symbol
+            timestamp: Timestamp of the bar being processed
         """
-        df = self._get_dataframe(symbol)
-        if df is None or len(df) < 50:
+        df = self._get_indicator_dataframe(symbol)
+        if df is None:
             return
         
-        # Calculate indicators
-        df = calculate_all_indicators(df)
-        
         # Evaluate each strategy
         for strategy in self.strategies:
             instruction = strategy.evaluate(
@@ -400,13 +552,18 @@ class PaperTradingEngine:
             
             # Process entry signals
             if instruction.signal == StrategySignal.ENTRY_LONG:
-                self._create_entry_order(instruction, df.iloc[-1]['close'])
+                self._create_entry_order(
+                    instruction,
+                    self.symbol_data[symbol].last_close,
+                    timestamp
+                )
                 break  # Only one strategy per symbol
     
     def _create_entry_order(
         self,
         instruction: TradeInstruction,
-        current_price: float
+        current_price: float,
+        timestamp: datetime
     ) -> None:
         """
         Create entry order.
@@ -414,6 +571,7 @@ class PaperTradingEngine:
         Args:
             instruction: Trade instruction from strategy
             current_price: Current market price
+            timestamp: Bar timestamp, used as the order's decision time
         """
         symbol = instruction.symbol
         
@@ -421,18 +579,18 @@ class PaperTradingEngine:
         is_allowed, reason = self.risk_manager.validate_trade(
             instruction,
             self.portfolio,
-            datetime.now()
+            timestamp
         )
         
         if not is_allowed:
-            logger.debug(f"Trade rejected by risk manager for {symbol}: {reason}")
+            logger.debug("Trade rejected by risk manager for {}: {}", symbol, reason)
             return
         
         # Calculate position size
         quantity = self.risk_manager.calculate_position_size(instruction, self.portfolio)
         
         if quantity == 0:
-            logger.debug(f"Position size calculated as 0 for {symbol}, skipping trade")
+            logger.debug("Position size calculated as 0 for {}, skipping trade", symbol)
             return
         
         # Create paper order
@@ -444,10 +602,11 @@ class PaperTradingEngine:
             stop_loss=instruction.stop_loss,
             target=instruction.target,
             strategy_name=instruction.strategy_name,
-            reason=instruction.reason
+            reason=instruction.reason,
+            created_time=timestamp
         )
         
-        self.pending_orders.append(order)
+        self.pending_orders.setdefault(symbol, []).append(order)
         logger.info(f"Created BUY order for {symbol}: {quantity} shares")
     
     def get_status(self) -> Dict:
@@ -458,26 +617,32 @@ class PaperTradingEngine:
             Dictionary with status information
         """
         with self.lock:
+            # Win/loss counts are maintained incrementally by the portfolio,
+            # so this stays O(1) regardless of trade history length
+            total_trades = len(self.trades)
+            winning_trades = self.portfolio.winning_trades
             return {
                 'portfolio_value': self.portfolio.get_total_value(),
                 'cash': self.portfolio.cash,
                 'realized_pnl': self.portfolio.realized_pnl,
                 'unrealized_pnl': self.portfolio.unrealized_pnl,
                 'daily_pnl': self.portfolio.daily_pnl,
-                'total_trades': len(self.trades),
-                'winning_trades': self.portfolio.winning_trades,
+                'total_trades': total_trades,
+                'winning_trades': winning_trades,
                 'losing_trades': self.portfolio.losing_trades,
+                'win_rate': (winning_trades / total_trades * 100) if total_trades > 0 else 0.0,
                 'open_positions': len(self.portfolio.positions),
-                'pending_orders': len(self.pending_orders),
+                'pending_orders': sum(len(orders) for orders in self.pending_orders.values()),
                 'symbols_tracked': len(self.symbol_data)
             }
     
-    def get_trades(self) -> List[Trade]:
-        """Get all executed trades."""
+    def get_trades(self) -> Tuple[Trade, ...]:
+        """Get all executed trades as an immutable snapshot."""
         with self.lock:
-            return self.trades.copy()
+            return tuple(self.trades)
     
     def get_portfolio(self) -> Portfolio:
-        """Get current portfolio state."""
+        """Get a snapshot of the current portfolio state."""
         with self.lock:
-            return self.portfolio
+            # Deep copy: positions are mutated in place by on_bar
+            return self.portfolio.model_copy(deep=True)
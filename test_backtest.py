@@ -4,7 +4,8 @@ This bypasses the Kite API requirement for testing purposes.
 """
 
 from datetime import datetime, timedelta
-import random
+
+import numpy as np
 
 from src.data.models import OHLCVBar
 from src.config import get_config
@@ -18,21 +19,22 @@ from src.core.strategies.ema_trend import EMATrendStrategy
 
 def generate_mock_data(symbol: str, start_date: datetime, num_bars: int = 100) -> list[OHLCVBar]:
     """Generate mock OHLCV data for testing."""
-    bars = []
+    rng = np.random.default_rng()
     base_price = 2500.0  # Starting price for RELIANCE
-    current_time = start_date
     
-    for i in range(num_bars):
-        # Simulate price movement
-        change = random.uniform(-20, 20)
-        open_price = base_price
-        high_price = base_price + abs(change) + random.uniform(0, 10)
-        low_price = base_price - abs(change) - random.uniform(0, 10)
-        close_price = base_price + change
-        volume = random.randint(100000, 500000)
-        
-        bar = OHLCVBar(
-            timestamp=current_time,
+    # Simulate price movement as a random walk: each bar opens at the
+    # previous close
+    changes = rng.uniform(-20, 20, num_bars)
+    opens = base_price + np.concatenate(([0.0], np.cumsum(changes[:-1])))
+    closes = opens + changes
+    highs = opens + np.abs(changes) + rng.uniform(0, 10, num_bars)
+    lows = opens - np.abs(changes) - rng.uniform(0, 10, num_bars)
+    volumes = rng.integers(100000, 500000, num_bars, endpoint=True)
+    
+    step = timedelta(minutes=5)
+    return [
+        OHLCVBar(
+            timestamp=start_date + i * step,
             open=open_price,
             high=high_price,
             low=low_price,
@@ -40,12 +42,10 @@ def generate_mock_data(symbol: str, start_date: datetime, num_bars: int = 100) -
             volume=volume,
             symbol=symbol
         )
-        bars.append(bar)
-        
-        base_price = close_price
-        current_time += timedelta(minutes=5)
-    
-    return bars
+        for i, (open_price, high_price, low_price, close_price, volume) in enumerate(zip(
+            opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist()
+        ))
+    ]
 
 
 def main():
@@ -4,9 +4,10 @@ This simulates live market data without requiring actual WebSocket connection.
 """
 
 from datetime import datetime, timedelta
-import random
 import time
 
+import numpy as np
+
 from src.data.models import OHLCVBar
 from src.config import get_config
 from src.paper.paper_engine import PaperTradingEngine
@@ -17,26 +18,29 @@ from src.core.strategies.ema_trend import EMATrendStrategy
 
 def generate_realistic_bars(symbol: str, num_bars: int = 100) -> list[OHLCVBar]:
     """Generate realistic OHLCV bars with trends."""
-    bars = []
+    rng = np.random.default_rng()
     base_price = 2500.0
-    current_time = datetime.now().replace(hour=9, minute=15, second=0, microsecond=0)
-    
-    # Create a trending market
-    trend_direction = 1  # 1 for up, -1 for down
-    
-    for i in range(num_bars):
-        # Add some trend
-        trend = trend_direction * random.uniform(0, 5)
-        noise = random.uniform(-10, 10)
-        
-        open_price = base_price
-        close_price = base_price + trend + noise
-        high_price = max(open_price, close_price) + random.uniform(0, 8)
-        low_price = min(open_price, close_price) - random.uniform(0, 8)
-        volume = random.randint(100000, 500000)
-        
-        bar = OHLCVBar(
-            timestamp=current_time,
+    start_time = datetime.now().replace(hour=9, minute=15, second=0, microsecond=0)
+    
+    # Create a trending market that starts up and reverses every 20 bars
+    index = np.arange(num_bars)
+    trend_direction = np.where((np.maximum(index - 1, 0) // 20) % 2 == 0, 1.0, -1.0)
+    
+    trend = trend_direction * rng.uniform(0, 5, num_bars)
+    noise = rng.uniform(-10, 10, num_bars)
+    moves = trend + noise
+    
+    # Each bar opens at the previous close
+    opens = base_price + np.concatenate(([0.0], np.cumsum(moves[:-1])))
+    closes = opens + moves
+    highs = np.maximum(opens, closes) + rng.uniform(0, 8, num_bars)
+    lows = np.minimum(opens, closes) - rng.uniform(0, 8, num_bars)
+    volumes = rng.integers(100000, 500000, num_bars, endpoint=True)
+    
+    step = timedelta(minutes=5)
+    return [
+        OHLCVBar(
+            timestamp=start_time + i * step,
             open=open_price,
             high=high_price,
             low=low_price,
@@ -44,16 +48,10 @@ def generate_realistic_bars(symbol: str, num_bars: int = 100) -> list[OHLCVBar]:
             volume=volume,
             symbol=symbol
         )
-        bars.append(bar)
-        
-        base_price = close_price
-        current_time += timedelta(minutes=5)
-        
-        # Occasionally reverse trend
-        if i % 20 == 0 and i > 0:
-            trend_direction *= -1
-    
-    return bars
+        for i, (open_price, high_price, low_price, close_price, volume) in enumerate(zip(
+            opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist()
+        ))
+    ]
 
 
 def main():
@@ -106,12 +104,17 @@ def main():
     bars = generate_realistic_bars('RELIANCE', num_bars=100)
     print(f"Generated {len(bars)} bars")
     
-    # Simulate live trading by feeding bars one at a time
+    # Strategies need 50 bars of history, so load the warm-up bars as one
+    # batch (as after a reconnect) instead of replaying them with delays
+    warmup = 50
+    engine.on_bars(bars[:warmup])
+    
+    # Simulate live trading by feeding the remaining bars one at a time
     print("\nStarting paper trading simulation...")
     print("Press Ctrl+C to stop\n")
     
     try:
-        for i, bar in enumerate(bars):
+        for i, bar in enumerate(bars[warmup:], warmup):
             # Feed bar to engine
             engine.on_bar(bar)
             
@@ -146,8 +149,7 @@ def main():
     print(f"Losing Trades: {status['losing_trades']}")
     
     if status['total_trades'] > 0:
-        win_rate = (status['winning_trades'] / status['total_trades']) * 100
-        print(f"Win Rate: {win_rate:.2f}%")
+        print(f"Win Rate: {status['win_rate']:.2f}%")
     
     # Print trade details
     if engine.get_trades():
@@ -0,0 +1,44 @@
+"""Tests for backtest engine."""
+
+from datetime import datetime, timedelta
+
+from src.backtest.backtest_engine import BacktestEngine
+from src.config import RiskConfig
+from src.core.risk import RiskManager
+from src.data.models import OHLCVBar
+
+
+def make_bar(timestamp: datetime, close: float, symbol: str = "TEST") -> OHLCVBar:
+    """Create a bar closing at the given price."""
+    return OHLCVBar(
+        timestamp=timestamp,
+        open=close,
+        high=close + 1,
+        low=close - 1,
+        close=close,
+        volume=1000,
+        symbol=symbol
+    )
+
+
+def test_duplicate_timestamp_uses_first_bar():
+    """Test that a duplicated timestamp resolves to its first bar."""
+    start = datetime(2024, 1, 15, 9, 15)
+    duplicate = start + timedelta(minutes=5)
+    bars = [
+        make_bar(start, 100.0),
+        make_bar(duplicate, 101.0),
+        make_bar(duplicate, 150.0),
+        make_bar(start + timedelta(minutes=10), 102.0),
+    ]
+    
+    risk_manager = RiskManager(RiskConfig(), initial_capital=100000)
+    engine = BacktestEngine([], risk_manager, initial_capital=100000)
+    engine.run({"TEST": bars})
+    
+    rows = engine.symbol_rows["TEST"]
+    df = engine.symbol_data["TEST"]
+    
+    assert rows[duplicate] == 1
+    assert df.iloc[rows[duplicate]]['close'] == 101.0
+    assert df[df['timestamp'] == duplicate].iloc[0]['close'] == 101.0
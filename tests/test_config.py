@@ -0,0 +1,30 @@
+"""Tests for configuration loading."""
+
+from src.config import get_config
+
+
+def test_get_config_cached_until_environment_changes(monkeypatch):
+    """Test that the config is reused until an environment variable changes."""
+    monkeypatch.setenv("INITIAL_CAPITAL", "250000")
+    first = get_config()
+    
+    assert get_config() is first
+    
+    monkeypatch.setenv("INITIAL_CAPITAL", "300000")
+    rebuilt = get_config()
+    
+    assert rebuilt is not first
+    assert rebuilt.initial_capital == 300000
+    
+    monkeypatch.delenv("INITIAL_CAPITAL")
+    assert get_config().initial_capital != 300000
+
+
+def test_get_config_ignores_overrides_on_copies():
+    """Test that overriding a copy leaves the shared config untouched."""
+    config = get_config()
+    overridden = config.model_copy(deep=True)
+    overridden.watchlist = ["OVERRIDE"]
+    
+    assert get_config() is config
+    assert get_config().watchlist != ["OVERRIDE"]
@@ -20,16 +20,17 @@ def sample_ohlcv_data():
     dates = pd.date_range(start='2024-01-01', periods=100, freq='5min')
     
     # Create synthetic price data with trend
-    np.random.seed(42)
-    close_prices = 100 + np.cumsum(np.random.randn(100) * 0.5)
+    rng = np.random.default_rng(42)
+    noise = rng.standard_normal((4, 100))
+    close_prices = 100 + np.cumsum(noise[0] * 0.5)
     
     df = pd.DataFrame({
         'timestamp': dates,
-        'open': close_prices + np.random.randn(100) * 0.2,
-        'high': close_prices + np.abs(np.random.randn(100) * 0.5),
-        'low': close_prices - np.abs(np.random.randn(100) * 0.5),
+        'open': close_prices + noise[1] * 0.2,
+        'high': close_prices + np.abs(noise[2] * 0.5),
+        'low': close_prices - np.abs(noise[3] * 0.5),
         'close': close_prices,
-        'volume': np.random.randint(1000, 10000, 100),
+        'volume': rng.integers(1000, 10000, 100),
         'symbol': 'TEST'
     })
     
@@ -0,0 +1,25 @@
+"""Tests for the command-line entry point."""
+
+from unittest.mock import patch
+
+from src.config import TradingMode, get_config
+from src.main import main
+
+
+@patch('src.main.run_backtest')
+@patch('src.main.create_llm_client')
+@patch('src.main.setup_logging')
+def test_cli_overrides_do_not_leak_between_runs(mock_logging, mock_llm, mock_backtest):
+    """Test that --symbols from one in-process run does not carry into the next."""
+    default_watchlist = list(get_config().watchlist)
+    
+    main(["--mode", "backtest", "--symbols", "AAA,BBB", "--date", "2024-01-15"])
+    main(["--mode", "backtest", "--date", "2024-01-15"])
+    
+    first_config, first_symbols, _ = mock_backtest.call_args_list[0].args
+    second_config, second_symbols, _ = mock_backtest.call_args_list[1].args
+    
+    assert first_symbols == ["AAA", "BBB"]
+    assert first_config.mode == TradingMode.BACKTEST
+    assert second_symbols == default_watchlist
+    assert get_config().watchlist == default_watchlist
@@ -0,0 +1,72 @@
+"""Tests for news broadcaster sent-URL history."""
+
+import json
+from unittest.mock import MagicMock
+
+from src.notifications.news_broadcaster import NewsBroadcaster
+
+
+def make_broadcaster(history_file):
+    """Create a broadcaster with mocked fetcher and notifier."""
+    return NewsBroadcaster(MagicMock(), MagicMock(), sent_news_file=str(history_file))
+
+
+def test_legacy_file_migrated_once(tmp_path):
+    """Test that a legacy JSON history is migrated into the log only once."""
+    history_file = tmp_path / "sent_news.jsonl"
+    legacy_file = tmp_path / "sent_news.json"
+    legacy_file.write_text(json.dumps({'sent_urls': ["https://a", "https://b"]}))
+    
+    broadcaster = make_broadcaster(history_file)
+    
+    assert broadcaster.sent_urls == {"https://a", "https://b"}
+    assert history_file.exists()
+    
+    # Later changes to the legacy file are ignored once the log exists
+    legacy_file.write_text(json.dumps({'sent_urls': ["https://c"]}))
+    broadcaster = make_broadcaster(history_file)
+    
+    assert broadcaster.sent_urls == {"https://a", "https://b"}
+
+
+def test_duplicate_lines_compacted(tmp_path):
+    """Test that duplicate log lines are compacted on load."""
+    history_file = tmp_path / "sent_news.jsonl"
+    history_file.write_text(
+        '"https://a"\n"https://b"\n"https://a"\n"https://a"\n'
+    )
+    
+    broadcaster = make_broadcaster(history_file)
+    
+    assert broadcaster.sent_urls == {"https://a", "https://b"}
+    lines = history_file.read_text().splitlines()
+    assert sorted(json.loads(line) for line in lines) == ["https://a", "https://b"]
+
+
+def test_corrupt_trailing_line_skipped(tmp_path):
+    """Test that a torn final write only loses that entry."""
+    history_file = tmp_path / "sent_news.jsonl"
+    history_file.write_text('"https://a"\n"https://b"\n"https://c')
+    
+    broadcaster = make_broadcaster(history_file)
+    
+    assert broadcaster.sent_urls == {"https://a", "https://b"}
+    
+    # The corrupt line is dropped by compaction
+    assert make_broadcaster(history_file).sent_urls == {"https://a", "https://b"}
+    assert len(history_file.read_text().splitlines()) == 2
+
+
+def test_appended_urls_reloaded(tmp_path):
+    """Test that appended URLs are visible to a new broadcaster."""
+    history_file = tmp_path / "sent_news.jsonl"
+    broadcaster = make_broadcaster(history_file)
+    
+    assert broadcaster.sent_urls == set()
+    
+    broadcaster._append_sent_urls(["https://a", "https://b"])
+    broadcaster._append_sent_urls(["https://c"])
+    
+    assert make_broadcaster(history_file).sent_urls == {
+        "https://a", "https://b", "https://c"
+    }
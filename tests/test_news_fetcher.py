@@ -1,11 +1,13 @@
 """Unit tests for news fetcher module."""
 
 import json
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 import pytest
+from feedparser import FeedParserDict
 
 from src.data.models import NewsArticle, NewsSource
 from src.data.news_fetcher import (
@@ -15,6 +17,24 @@ from src.data.news_fetcher import (
     NSEAnnouncementsAdapter
 )
 
+# Fixed timestamp for articles whose publish time does not matter
+_NOW = datetime(2024, 1, 15, 10, 0, 0)
+
+
+def make_entry(
+    title: str,
+    link: str,
+    summary: str,
+    published_parsed: tuple = (2024, 1, 15, 10, 30, 0, 0, 0, 0)
+) -> FeedParserDict:
+    """Create a parsed RSS entry as feedparser returns it."""
+    return FeedParserDict(
+        title=title,
+        link=link,
+        summary=summary,
+        published_parsed=published_parsed
+    )
+
 
 @pytest.fixture
 def temp_cache_dir(tmp_path):
@@ -40,21 +60,16 @@ class TestEconomicTimesAdapter:
     @patch('feedparser.parse')
     def test_fetch_success(self, mock_parse):
         """Test successful news fetching."""
-        # Create mock entry objects with attributes
-        entry1 = MagicMock()
-        entry1.title = 'Test headline 1'
-        entry1.link = 'https://example.com/1'
-        entry1.get = MagicMock(side_effect=lambda key, default='': {'summary': 'Test summary 1'}.get(key, default))
-        entry1.published_parsed = (2024, 1, 15, 10, 30, 0, 0, 0, 0)
-        
-        entry2 = MagicMock()
-        entry2.title = 'Test headline 2'
-        entry2.link = 'https://example.com/2'
-        entry2.get = MagicMock(side_effect=lambda key, default='': {'summary': 'Test summary 2'}.get(key, default))
-        entry2.published_parsed = (2024, 1, 15, 11, 0, 0, 0, 0, 0)
+        entry1 = make_entry('Test headline 1', 'https://example.com/1', 'Test summary 1')
+        entry2 = make_entry(
+            'Test headline 2',
+            'https://example.com/2',
+            'Test summary 2',
+            published_parsed=(2024, 1, 15, 11, 0, 0, 0, 0, 0)
+        )
         
         # Mock RSS feed response
-        mock_parse.return_value = MagicMock(entries=[entry1, entry2])
+        mock_parse.return_value = FeedParserDict(entries=[entry1, entry2])
         
         adapter = EconomicTimesAdapter()
         articles = adapter.fetch(max_articles=10)
@@ -68,19 +83,59 @@ class TestEconomicTimesAdapter:
         adapter = EconomicTimesAdapter()
         
         with patch('feedparser.parse') as mock_parse:
-            # Create mock entry with attributes
-            entry = MagicMock()
-            entry.title = 'RELIANCE stock surges'
-            entry.link = 'https://example.com/1'
-            entry.get = MagicMock(side_effect=lambda key, default='': {'summary': 'RELIANCE gains 5%'}.get(key, default))
-            entry.published_parsed = (2024, 1, 15, 10, 30, 0, 0, 0, 0)
+            entry = make_entry('RELIANCE stock surges', 'https://example.com/1', 'RELIANCE gains 5%')
             
-            mock_parse.return_value = MagicMock(entries=[entry])
+            mock_parse.return_value = FeedParserDict(entries=[entry])
             
             articles = adapter.fetch(symbols=['RELIANCE'], max_articles=10)
             
             assert len(articles) > 0
             assert 'RELIANCE' in articles[0].symbols
+    
+    @patch('feedparser.parse')
+    def test_symbol_filter_matches_whole_symbols(self, mock_parse):
+        """Test that symbols match only as whole tokens."""
+        entry = make_entry('M&M and Bajaj-Auto rally while TCSL slips', 'https://example.com/1', 'Infy flat')
+        
+        mock_parse.return_value = FeedParserDict(entries=[entry])
+        
+        adapter = EconomicTimesAdapter()
+        articles = adapter.fetch(symbols=['TCS', 'm&m', 'BAJAJ-AUTO', 'INFY'], max_articles=10)
+        
+        assert sorted(articles[0].symbols) == ['BAJAJ-AUTO', 'INFY', 'M&M']
+    
+    @patch('feedparser.parse')
+    def test_fetch_reuses_recent_feed(self, mock_parse):
+        """Test that repeat fetches within the feed TTL skip parsing."""
+        entry = make_entry('Test headline', 'https://example.com/1', 'Test summary')
+        
+        mock_parse.return_value = FeedParserDict(entries=[entry])
+        
+        adapter = EconomicTimesAdapter()
+        first = adapter.fetch(max_articles=10)
+        second = adapter.fetch(max_articles=10)
+        
+        assert mock_parse.call_count == len(EconomicTimesAdapter.RSS_FEEDS)
+        assert [a.url for a in first] == [a.url for a in second]
+    
+    @patch('feedparser.parse')
+    def test_fetch_not_modified_reuses_feed(self, mock_parse):
+        """Test conditional GET once the feed TTL has expired."""
+        entry = make_entry('Test headline', 'https://example.com/1', 'Test summary')
+        
+        feed = FeedParserDict(entries=[entry], etag='"v1"')
+        not_modified = FeedParserDict(entries=[], status=304)
+        mock_parse.return_value = feed
+        
+        adapter = EconomicTimesAdapter()
+        adapter.FEED_TTL = 0
+        adapter.fetch(max_articles=10)
+        
+        mock_parse.return_value = not_modified
+        articles = adapter.fetch(max_articles=10)
+        
+        assert mock_parse.call_args.kwargs['etag'] == '"v1"'
+        assert len(articles) == len(EconomicTimesAdapter.RSS_FEEDS)
 
 
 class TestGoogleNewsAdapter:
@@ -89,14 +144,9 @@ class TestGoogleNewsAdapter:
     @patch('feedparser.parse')
     def test_fetch_success(self, mock_parse):
         """Test successful news fetching."""
-        # Create mock entry with attributes
-        entry = MagicMock()
-        entry.title = 'Indian market news'
-        entry.link = 'https://news.google.com/1'
-        entry.get = MagicMock(side_effect=lambda key, default='': {'summary': 'Market summary'}.get(key, default))
-        entry.published_parsed = (2024, 1, 15, 10, 30, 0, 0, 0, 0)
+        entry = make_entry('Indian market news', 'https://news.google.com/1', 'Market summary')
         
-        mock_parse.return_value = MagicMock(entries=[entry])
+        mock_parse.return_value = FeedParserDict(entries=[entry])
         
         adapter = GoogleNewsAdapter()
         articles = adapter.fetch(max_articles=10)
@@ -104,11 +154,26 @@ class TestGoogleNewsAdapter:
         assert len(articles) > 0
         assert all(a.source == NewsSource.GOOGLE_NEWS for a in articles)
 
+    
+    @patch('feedparser.parse')
+    def test_feed_cache_evicts_least_recently_used(self, mock_parse):
+        """Test that per-query feeds don't grow the cache without bound."""
+        entry = make_entry('Indian market news', 'https://news.google.com/1', 'Market summary')
+        
+        mock_parse.return_value = FeedParserDict(entries=[entry])
+        
+        adapter = GoogleNewsAdapter()
+        adapter.FEED_CACHE_SIZE = 3
+        adapter.fetch(symbols=['A', 'B', 'C', 'D', 'E'], max_articles=10)
+        
+        fetched_urls = [call.args[0] for call in mock_parse.call_args_list]
+        assert len(fetched_urls) == 6
+        assert list(adapter._feed_cache) == fetched_urls[-3:]
 
 class TestNSEAnnouncementsAdapter:
     """Tests for NSE announcements adapter."""
     
-    @patch('requests.get')
+    @patch('src.data.news_fetcher.NSEAnnouncementsAdapter._SESSION.get')
     def test_fetch_success(self, mock_get):
         """Test successful announcement fetching."""
         mock_response = Mock()
@@ -148,19 +213,19 @@ class TestNewsFetcher:
                 title="Test 1",
                 source=NewsSource.ECONOMIC_TIMES,
                 url="https://example.com/1",
-                published_at=datetime.now()
+                published_at=_NOW
             ),
             NewsArticle(
                 title="Test 2",
                 source=NewsSource.GOOGLE_NEWS,
                 url="https://example.com/1",  # Same URL
-                published_at=datetime.now()
+                published_at=_NOW
             ),
             NewsArticle(
                 title="Test 3",
                 source=NewsSource.ECONOMIC_TIMES,
                 url="https://example.com/2",
-                published_at=datetime.now()
+                published_at=_NOW
             )
         ]
         
@@ -169,6 +234,114 @@ class TestNewsFetcher:
         assert len(deduplicated) == 2  # Should remove one duplicate
         assert len(set(a.url for a in deduplicated)) == 2
     
+    def test_deduplication_near_duplicates(self, news_fetcher):
+        """Test that tracking params and reworded copies are collapsed."""
+        summary = "Reliance Industries reported a rise in quarterly net profit driven by retail and telecom"
+        articles = [
+            NewsArticle(
+                title="Reliance Q3 profit jumps 10%, beats estimates",
+                source=NewsSource.ECONOMIC_TIMES,
+                url="https://example.com/markets/reliance-q3",
+                published_at=_NOW,
+                summary=summary
+            ),
+            NewsArticle(
+                title="Reliance Q3 profit jumps 10%, beats estimates",
+                source=NewsSource.ECONOMIC_TIMES,
+                url="https://example.com/markets/reliance-q3/?utm_source=rss#top",
+                published_at=_NOW
+            ),
+            NewsArticle(
+                title="RELIANCE Q3 — Profit Jumps 10% & Beats Estimates!",
+                source=NewsSource.GOOGLE_NEWS,
+                url="https://news.example.org/articles/abc123",
+                published_at=_NOW,
+                summary=summary
+            ),
+            NewsArticle(
+                title="TCS shares fall after weak deal wins",
+                source=NewsSource.GOOGLE_NEWS,
+                url="https://news.example.org/articles/def456",
+                published_at=_NOW,
+                summary="Tata Consultancy Services slipped as order inflow disappointed"
+            )
+        ]
+        
+        deduplicated = news_fetcher._deduplicate(articles)
+        
+        assert [a.url for a in deduplicated] == [
+            "https://example.com/markets/reliance-q3",
+            "https://news.example.org/articles/def456"
+        ]
+    
+    def test_deduplication_keeps_boilerplate_filings(self, news_fetcher):
+        """Test that near-identical texts about different companies survive."""
+        summary = (
+            "Trading window for dealing in securities of the Company will remain closed "
+            "for designated persons till 48 hours after declaration of financial results"
+        )
+        articles = [
+            NewsArticle(
+                title=f"{symbol}: Closure of Trading Window",
+                source=NewsSource.NSE_ANNOUNCEMENTS,
+                url=f"https://nsearchives.nseindia.com/corporate/{symbol}_window.pdf",
+                published_at=_NOW,
+                summary=summary,
+                symbols=[symbol]
+            )
+            for symbol in ("TCS", "INFY")
+        ] + [
+            NewsArticle(
+                title="Board approves interim dividend",
+                source=NewsSource.ECONOMIC_TIMES,
+                url=f"https://example.com/{symbol}/dividend",
+                published_at=_NOW,
+                summary=summary,
+                symbols=[symbol]
+            )
+            for symbol in ("WIPRO", "HCLTECH")
+        ]
+        
+        deduplicated = news_fetcher._deduplicate(articles)
+        
+        assert deduplicated == articles
+    
+    def test_parallel_fetch(self, news_fetcher):
+        """Test that sources are fetched concurrently and errors are isolated."""
+        # Each fetch blocks until all three are in flight; a sequential
+        # fetcher breaks the barrier and loses the articles
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def slow_fetch(name):
+            def fetch(symbols=None, max_articles=50):
+                barrier.wait()
+                return [
+                    NewsArticle(
+                        title=f"{name} headline",
+                        source=NewsSource.UNKNOWN,
+                        url=f"https://example.com/{name}",
+                        published_at=datetime.now()
+                    )
+                ]
+            return fetch
+        
+        def failing_fetch(symbols=None, max_articles=50):
+            barrier.wait()
+            raise RuntimeError("source down")
+        
+        news_fetcher.adapters = {
+            "economic_times": Mock(fetch=slow_fetch("et")),
+            "google_news": Mock(fetch=failing_fetch),
+            "nse_announcements": Mock(fetch=slow_fetch("nse")),
+        }
+        
+        articles = news_fetcher.fetch_news(use_cache=False)
+        
+        assert sorted(a.url for a in articles) == [
+            "https://example.com/et",
+            "https://example.com/nse"
+        ]
+    
     def test_filter_by_age(self, news_fetcher):
         """Test filtering by article age."""
         now = datetime.now()
@@ -199,7 +372,7 @@ class TestNewsFetcher:
                 title="Test Article",
                 source=NewsSource.ECONOMIC_TIMES,
                 url="https://example.com/test",
-                published_at=datetime.now(),
+                published_at=_NOW,
                 summary="Test summary",
                 symbols=["RELIANCE"]
             )
@@ -215,6 +388,35 @@ class TestNewsFetcher:
         assert len(loaded) == 1
         assert loaded[0].title == "Test Article"
         assert loaded[0].symbols == ["RELIANCE"]
+        
+        # A fresh fetcher has no memory cache and must read the file
+        reloaded = NewsFetcher(cache_dir=news_fetcher.cache_dir)._load_from_cache(None)
+        
+        assert reloaded is not None
+        assert reloaded[0].url == "https://example.com/test"
+        assert reloaded[0].published_at == _NOW
+    
+    def test_cache_memory_hit_skips_disk(self, news_fetcher):
+        """Test that warm cache loads are served from memory."""
+        articles = [
+            NewsArticle(
+                title="Test Article",
+                source=NewsSource.ECONOMIC_TIMES,
+                url="https://example.com/test",
+                published_at=_NOW
+            )
+        ]
+        news_fetcher._save_to_cache(articles, ["RELIANCE"])
+        
+        with patch.object(Path, 'read_bytes') as mock_read:
+            first = news_fetcher._load_from_cache(["RELIANCE"])
+            second = news_fetcher._load_from_cache(["RELIANCE"])
+        
+        mock_read.assert_not_called()
+        assert first == second == articles
+        
+        news_fetcher.clear_cache()
+        assert news_fetcher._load_from_cache(["RELIANCE"]) is None
     
     def test_clear_cache(self, news_fetcher):
         """Test cache clearing."""
@@ -223,7 +425,7 @@ class TestNewsFetcher:
                 title="Test",
                 source=NewsSource.ECONOMIC_TIMES,
                 url="https://example.com/test",
-                published_at=datetime.now()
+                published_at=_NOW
             )
         ]
         
@@ -243,14 +445,14 @@ class TestNewsArticleModel:
             title="Test 1",
             source=NewsSource.ECONOMIC_TIMES,
             url="https://example.com/1",
-            published_at=datetime.now()
+            published_at=_NOW
         )
         
         article2 = NewsArticle(
             title="Test 2",  # Different title
             source=NewsSource.GOOGLE_NEWS,  # Different source
             url="https://example.com/1",  # Same URL
-            published_at=datetime.now()
+            published_at=_NOW
         )
         
         assert article1 == article2  # Should be equal (same URL)
@@ -0,0 +1,144 @@
+"""Tests for paper trading engine."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.config import RiskConfig
+from src.core.risk import RiskManager
+from src.data.models import OHLCVBar, StrategySignal, TradeInstruction
+from src.paper.paper_engine import BarBuffer, PaperOrder, PaperTradingEngine
+
+
+def make_bars(count: int, symbol: str = "TEST") -> list:
+    """Create sequential 5-minute bars with increasing prices."""
+    start = datetime(2024, 1, 15, 9, 15)
+    return [
+        OHLCVBar(
+            timestamp=start + timedelta(minutes=5 * i),
+            open=100.0 + i,
+            high=101.0 + i,
+            low=99.0 + i,
+            close=100.5 + i,
+            volume=1000 + i,
+            symbol=symbol
+        )
+        for i in range(count)
+    ]
+
+
+def test_bar_buffer_keeps_latest_bars():
+    """Test that the buffer keeps only the most recent bars, in order."""
+    buffer = BarBuffer(capacity=5)
+    bars = make_bars(23)
+    
+    for bar in bars:
+        buffer.append(bar)
+    
+    df = buffer.to_dataframe()
+    
+    assert len(buffer) == 5
+    assert list(df['close']) == [bar.close for bar in bars[-5:]]
+    assert list(df['volume']) == [bar.volume for bar in bars[-5:]]
+    assert list(df.index) == [bar.timestamp for bar in bars[-5:]]
+    assert (df['timestamp'] == df.index).all()
+
+
+def test_bar_buffer_partial_window():
+    """Test DataFrame shape before the buffer is full."""
+    buffer = BarBuffer(capacity=200)
+    
+    for bar in make_bars(3):
+        buffer.append(bar)
+    
+    df = buffer.to_dataframe()
+    
+    assert len(df) == 3
+    assert df.index.name == 'timestamp'
+    assert df['open'].iloc[0] == pytest.approx(100.0)
+
+
+def test_on_bars_groups_backlog_by_symbol():
+    """Test that batch ingestion extends each symbol's history in order."""
+    risk_manager = RiskManager(RiskConfig(), initial_capital=100000)
+    engine = PaperTradingEngine([], risk_manager, initial_capital=100000)
+    backlog = [bar for pair in zip(make_bars(60, "AAA"), make_bars(60, "BBB")) for bar in pair]
+    
+    engine.on_bars(backlog)
+    
+    assert engine.get_status()['symbols_tracked'] == 2
+    df = engine._get_dataframe("AAA")
+    assert len(df) == 60
+    assert df.index.is_monotonic_increasing
+    assert df['close'].iloc[-1] == pytest.approx(backlog[-2].close)
+
+
+def test_on_bars_exits_on_intermediate_stop():
+    """Test that a backlog bar breaching the stop exits the position."""
+    risk_manager = RiskManager(RiskConfig(), initial_capital=100000)
+    engine = PaperTradingEngine([], risk_manager, initial_capital=100000)
+    engine.pending_orders["AAA"] = [
+        PaperOrder(
+            symbol="AAA",
+            quantity=10,
+            order_type="market",
+            side="buy",
+            stop_loss=98.0,
+            target=110.0,
+            strategy_name="test"
+        )
+    ]
+    
+    start = datetime(2024, 1, 15, 10, 0)
+    closes = [100.5, 97.0, 105.0, 106.0]
+    aaa = [
+        OHLCVBar(
+            timestamp=start + timedelta(minutes=5 * i),
+            open=100.0 + i,
+            high=max(100.0 + i, close) + 1,
+            low=min(100.0 + i, close) - 1,
+            close=close,
+            volume=1000,
+            symbol="AAA"
+        )
+        for i, close in enumerate(closes)
+    ]
+    bbb = [bar.model_copy(update={'symbol': "BBB"}) for bar in aaa]
+    
+    # Backlog arrives grouped by symbol rather than in time order
+    engine.on_bars(bbb + aaa)
+    
+    trades = engine.get_trades()
+    assert len(trades) == 1
+    assert trades[0].entry_price == pytest.approx(100.0)
+    assert trades[0].exit_price == pytest.approx(97.0)
+    assert trades[0].exit_reason == "stop_loss"
+    assert trades[0].exit_time == aaa[1].timestamp
+    assert "AAA" not in engine.get_portfolio().positions
+
+
+def test_entry_order_uses_bar_timestamp():
+    """Test that entry orders are validated and stamped with the bar time."""
+    risk_manager = RiskManager(RiskConfig(), initial_capital=100000)
+    engine = PaperTradingEngine([], risk_manager, initial_capital=100000)
+    instruction = TradeInstruction(
+        signal=StrategySignal.ENTRY_LONG,
+        symbol="TEST",
+        quantity=0,
+        stop_loss=98.0,
+        reason="test",
+        strategy_name="test",
+        entry_price=100.0
+    )
+    bar_time = datetime(2024, 1, 15, 10, 30)
+    
+    engine._create_entry_order(instruction, 100.0, bar_time)
+    
+    order = engine.pending_orders["TEST"][0]
+    assert order.created_time == bar_time
+    
+    # Past the entry cutoff the bar time, not the wall clock, rejects the trade
+    late = instruction.model_copy(update={'symbol': "LATE"})
+    engine._create_entry_order(late, 100.0, datetime(2024, 1, 15, 15, 20))
+    
+    assert "LATE" not in engine.pending_orders
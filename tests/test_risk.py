@@ -172,9 +172,9 @@ def test_risk_metrics(risk_manager, portfolio):
     
     metrics = risk_manager.get_risk_metrics(portfolio)
     
-    assert metrics["daily_pnl"] == -1500.0
-    assert metrics["daily_trades"] == 5
-    assert metrics["daily_losing_trades"] == 2
-    assert metrics["kill_switch_active"] == False
-    assert metrics["daily_loss_limit"] == 3000.0  # 3% of 100k
-    assert 0 < metrics["daily_loss_used_pct"] < 100
+    assert metrics.daily_pnl == -1500.0
+    assert metrics.daily_trades == 5
+    assert metrics.daily_losing_trades == 2
+    assert metrics.kill_switch_active == False
+    assert metrics.daily_loss_limit == 3000.0  # 3% of 100k
+    assert 0 < metrics.daily_loss_used_pct < 100
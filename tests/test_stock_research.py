@@ -8,6 +8,9 @@ import pytest
 from src.data.models import NewsArticle, NewsSource, SentimentAnalysis, Sentiment
 from src.llm.stock_research import StockResearcher
 
+# Fixed timestamp for articles whose publish time does not matter
+_NOW = datetime(2024, 1, 15, 10, 0, 0)
+
 
 @pytest.fixture
 def mock_news_fetcher():
@@ -18,7 +21,7 @@ def mock_news_fetcher():
             title="RELIANCE announces Q3 results",
             source=NewsSource.ECONOMIC_TIMES,
             url="https://example.com/1",
-            published_at=datetime.now(),
+            published_at=_NOW,
             summary="Strong quarterly results",
             symbols=["RELIANCE"]
         ),
@@ -26,7 +29,7 @@ def mock_news_fetcher():
             title="RELIANCE stock surges on positive news",
             source=NewsSource.GOOGLE_NEWS,
             url="https://example.com/2",
-            published_at=datetime.now(),
+            published_at=_NOW,
             summary="Stock gains 5%",
             symbols=["RELIANCE"]
         )
@@ -87,13 +90,21 @@ class TestStockResearcher:
         assert len(research.risk_factors) > 0
         assert research.recommendation != ""
     
-    def test_research_stock_no_news(self, stock_researcher, mock_news_fetcher):
+    def test_research_stock_no_news(
+        self,
+        stock_researcher,
+        mock_news_fetcher,
+        mock_sentiment_analyzer,
+        mock_llm_client
+    ):
         """Test research when no news is available."""
         mock_news_fetcher.fetch_stock_news.return_value = []
         
         research = stock_researcher.research_stock("UNKNOWN", max_articles=10)
         
         assert research is None
+        mock_sentiment_analyzer.analyze.assert_not_called()
+        mock_llm_client.generate.assert_not_called()
     
     def test_research_batch(self, stock_researcher):
         """Test batch research."""
@@ -103,6 +114,17 @@ class TestStockResearcher:
         assert len(results) > 0
         assert all(r.symbol in symbols for r in results)
     
+    def test_research_batch_keeps_order(self, stock_researcher, mock_news_fetcher):
+        """Test that batch results follow input order and skip failures."""
+        articles = mock_news_fetcher.fetch_stock_news.return_value
+        mock_news_fetcher.fetch_stock_news.side_effect = (
+            lambda symbol, max_articles: [] if symbol == "TCS" else articles
+        )
+        
+        results = stock_researcher.research_batch(["RELIANCE", "TCS", "INFY", "HDFCBANK"])
+        
+        assert [r.symbol for r in results] == ["RELIANCE", "INFY", "HDFCBANK"]
+    
     def test_generate_report(self, stock_researcher):
         """Test report generation."""
         research = stock_researcher.research_stock("RELIANCE", max_articles=10)
@@ -132,7 +154,7 @@ class TestStockResearcher:
                 title="Test",
                 source=NewsSource.ECONOMIC_TIMES,
                 url="https://example.com/1",
-                published_at=datetime.now()
+                published_at=_NOW
             )
         ]
         
@@ -147,7 +169,7 @@ class TestStockResearcher:
                 title="Positive news",
                 source=NewsSource.ECONOMIC_TIMES,
                 url="https://example.com/1",
-                published_at=datetime.now(),
+                published_at=_NOW,
                 summary="Good news summary"
             )
         ]
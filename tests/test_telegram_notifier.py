@@ -0,0 +1,178 @@
+"""Tests for Telegram notifier."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from telegram.error import RetryAfter, TelegramError
+
+from src.notifications.telegram_notifier import (
+    MAX_MESSAGE_LENGTH,
+    RateLimiter,
+    TelegramNotifier,
+    _chunk_message,
+)
+
+
+@pytest.fixture
+def notifier():
+    """Create notifier with a mocked bot and an unthrottled rate limiter."""
+    notifier = TelegramNotifier("123456:TEST_TOKEN", "test_chat")
+    notifier.bot = AsyncMock()
+    notifier.rate_limiter = RateLimiter(max_calls=1000, period=1.0)
+    yield notifier
+    notifier.close()
+
+
+def test_connection_pool_independent_of_rate_limit():
+    """Test that the HTTP pool size does not follow the rate limiter."""
+    with patch('src.notifications.telegram_notifier.HTTPXRequest') as mock_request:
+        notifier = TelegramNotifier("123456:TEST_TOKEN", "test_chat")
+    
+    try:
+        assert notifier.rate_limiter.max_calls == 1
+        mock_request.assert_called_once_with(
+            connection_pool_size=TelegramNotifier.CONNECTION_POOL_SIZE
+        )
+        assert TelegramNotifier.CONNECTION_POOL_SIZE == 8
+    finally:
+        notifier.bot = AsyncMock()
+        notifier.close()
+
+
+def test_chunk_short_message():
+    """Test that short messages are not split."""
+    assert _chunk_message("hello\nworld") == ["hello\nworld"]
+
+
+def test_chunk_long_message():
+    """Test that long messages are split on line boundaries."""
+    lines = [f"line {i:04d} " + "x" * 40 for i in range(200)]
+    message = "\n".join(lines)
+    
+    chunks = _chunk_message(message)
+    
+    assert len(chunks) > 1
+    assert all(len(chunk) <= MAX_MESSAGE_LENGTH for chunk in chunks)
+    assert "\n".join(chunks) == message
+
+
+def test_chunk_oversized_line():
+    """Test that a single line over the limit is cut."""
+    chunks = _chunk_message("a" * 25, limit=10)
+    
+    assert chunks == ["a" * 10, "a" * 10, "a" * 5]
+
+
+def test_send_long_message_in_order(notifier):
+    """Test that oversized messages are sent as ordered chunks."""
+    message = "\n".join(f"trade {i} " + "y" * 60 for i in range(150))
+    
+    assert notifier.send_message_sync(message)
+    
+    sent = [call.kwargs['text'] for call in notifier.bot.send_message.call_args_list]
+    assert len(sent) > 1
+    assert "\n".join(sent) == message
+
+
+def test_send_messages_in_order(notifier):
+    """Test that batch messages are sent one at a time in input order."""
+    sent = []
+    
+    async def fake_send(chat_id, text, parse_mode):
+        # Earlier messages take longer; concurrent sends would reorder them
+        await asyncio.sleep(0.05 if text == "a" else 0)
+        sent.append(text)
+        if text == "b":
+            raise TelegramError("boom")
+    
+    notifier.bot.send_message.side_effect = fake_send
+    
+    assert notifier.send_messages_sync(["a", "b", "c"]) == [True, False, True]
+    assert sent == ["a", "b", "c"]
+
+
+def test_send_messages_timeout_keeps_completed_results(notifier):
+    """Test that a batch timeout still reports messages already delivered."""
+    async def fake_send(chat_id, text, parse_mode):
+        if text == "b":
+            await asyncio.sleep(10)
+    
+    notifier.bot.send_message.side_effect = fake_send
+    notifier.SYNC_SEND_TIMEOUT = 0.2
+    
+    results = notifier.send_messages_sync(["a", "b", "c"])
+    
+    assert results == [True, False, False]
+
+
+def test_send_retries_after_flood_control(notifier):
+    """Test that RetryAfter pauses the limiter and the send is retried."""
+    notifier.bot.send_message.side_effect = [RetryAfter(0), None]
+    
+    assert notifier.send_message_sync("hello")
+    assert notifier.bot.send_message.call_count == 2
+
+
+def test_send_gives_up_after_max_attempts(notifier):
+    """Test that persistent flood control fails the send."""
+    notifier.bot.send_message.side_effect = RetryAfter(0)
+    
+    assert not notifier.send_message_sync("hello")
+    assert notifier.bot.send_message.call_count == TelegramNotifier.MAX_SEND_ATTEMPTS
+
+
+def test_rate_limiter_spaces_calls():
+    """Test that calls beyond the window limit wait for the window to pass."""
+    limiter = RateLimiter(max_calls=2, period=0.2)
+    
+    async def acquire_three():
+        for _ in range(3):
+            await limiter.acquire()
+    
+    start = time.monotonic()
+    asyncio.run(acquire_three())
+    
+    assert time.monotonic() - start >= 0.2
+
+
+def test_rate_limiter_pause_blocks_calls():
+    """Test that pausing the limiter delays the next call."""
+    limiter = RateLimiter(max_calls=10, period=1.0)
+    limiter.pause(0.2)
+    
+    start = time.monotonic()
+    asyncio.run(limiter.acquire())
+    
+    assert time.monotonic() - start >= 0.2
+
+
+def test_notifiers_share_chat_rate_limiter():
+    """Test that notifiers posting to one chat share its rate limiter."""
+    first = TelegramNotifier("123456:TEST_TOKEN", "shared_chat")
+    second = TelegramNotifier("123456:TEST_TOKEN", "shared_chat")
+    other = TelegramNotifier("123456:TEST_TOKEN", "other_chat")
+    
+    try:
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is not other.rate_limiter
+        assert first.rate_limiter.max_calls == 1
+    finally:
+        for notifier in (first, second, other):
+            notifier.close()
+
+
+def test_close_stops_event_loop():
+    """Test that close shuts down the bot and stops the loop thread."""
+    notifier = TelegramNotifier("123456:TEST_TOKEN", "test_chat")
+    notifier.bot = AsyncMock()
+    
+    notifier.close()
+    
+    notifier.bot.shutdown.assert_awaited_once()
+    assert not notifier._loop_thread.is_alive()
+    assert notifier._loop.is_closed()
+    
+    # Closing twice is harmless
+    notifier.close()